@@ -10,13 +10,16 @@ The optional --area-size flag defines the maximum bed dimensions to display (in
 from __future__ import annotations
 
 import argparse
+import collections
+import functools
+import json
 import os
 import math
 import asyncio
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import re
 import xml.etree.ElementTree as ET
@@ -24,7 +27,7 @@ import xml.etree.ElementTree as ET
 from nicegui import events, ui
 
 from pattern import Circle, Line, Pattern, Polyline, DEFAULT_PEN_COLORS, Renderer, RendererCancelled, estimate_run_time
-from penplot_helper import Config, GRBL, Compensation, Rect
+from penplot_helper import Config, GRBL, Compensation, Rect, _clamp
 
 try:
     from serial.tools import list_ports
@@ -35,9 +38,72 @@ except Exception:  # pragma: no cover - optional dependency safeguard
 DEFAULT_BED_SIZE: Tuple[float, float] = (300.0, 245.0)
 DEFAULT_RECT_SIZE: Tuple[float, float] = (300.0, 245.0)
 APP_CONFIG: Dict[str, Any] = {"serial_device": None, "bed_size": DEFAULT_BED_SIZE}
-
-
-@dataclass
+CORNER_KEYS = ("BL", "BR", "TL", "TR")
+CORNERS_SET = frozenset(CORNER_KEYS)
+# Grid cell (canvas px) for the hit-test index; must be at least the largest handle radius.
+PICK_CELL_SIZE = 16.0
+# Only the bottom-left and top-right corners define the work area and can be dragged.
+DRAGGABLE_CORNERS = frozenset({"BL", "TR"})
+# Canvas offset of each corner's height label relative to its handle.
+LABEL_OFFSETS: Dict[str, Tuple[int, int]] = {
+    "BL": (-16, 20),
+    "BR": (16, 20),
+    "TL": (-16, -16),
+    "TR": (16, -16),
+}
+
+# Outer canvas markup; _render_canvas fills in the size, bed, grid and overlay body.
+SVG_SHELL = (
+    '<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+    'xmlns="http://www.w3.org/2000/svg" style="user-select:none;">'
+    "<defs><style>"
+    " .grid-line {{ stroke: #d1d5db; stroke-width: 1; }}"
+    " .pattern-stroke {{ fill: none; stroke-linecap: round; stroke-linejoin: round; }} "
+    "</style></defs>"
+    '<rect x="{bed_left:.1f}" y="{bed_top:.1f}" width="{bed_w_px:.1f}" height="{bed_h_px:.1f}" '
+    'fill="#f8fafc" stroke="#4b5563" stroke-width="2" rx="12" />'
+    '<g class="grid-line">{grid}</g>'
+    "{body}"
+    "</svg>"
+)
+
+QUICK_SIZE_PRESETS: Dict[str, Tuple[float, float]] = {
+    "A4": (297.0, 210.0),
+    "A5": (210.0, 148.0),
+    "15 cm": (150.0, 150.0),
+    "10 cm": (100.0, 100.0),
+}
+
+# (attribute, label, value, min, max, step) for the "Pen Motion" config fields.
+PEN_MOTION_FIELDS: Tuple[Tuple[str, str, float, float, float, float], ...] = (
+    ("cfg_default_pen_pressure", "Default pen pressure", -0.1, -1.0, 1.0, 0.01),
+    ("cfg_lift_delta", "Lift delta", 0.4, 0.0, 1.0, 0.01),
+    ("cfg_settle_down", "Settle down (s)", 0.15, 0.0, 5.0, 0.01),
+    ("cfg_settle_up", "Settle up (s)", 0.15, 0.0, 5.0, 0.01),
+    ("cfg_z_step", "Z step", 0.05, 0.0, 1.0, 0.01),
+    ("cfg_z_step_delay", "Z step delay (s)", 0.00, 0.0, 1.0, 0.005),
+)
+
+_SVG_TRANSFORM_RE = re.compile(r"([a-zA-Z]+)\s*\(([^)]*)\)")
+_SVG_NUMBER_RE = re.compile(r"[-+]?((\d*\.\d+)|(\d+))(?:[eE][-+]?\d+)?")
+_SVG_PATH_PARAM_COUNTS: Dict[str, int] = {
+    'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0
+}
+
+
+class JogButton(NamedTuple):
+    """Canvas rectangle of a jog button and the world offset it applies."""
+
+    x: float
+    y: float
+    width: float
+    height: float
+    label: str
+    dx: float
+    dy: float
+
+
+@dataclass(slots=True)
 class Pot:
     """Simple representation of a color sampling pot."""
 
@@ -47,13 +113,20 @@ class Pot:
     position: tuple[float, float] = (0.0, 0.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlotterState:
     """Aggregates all mutable UI state for the mock implementation."""
 
     z_height: float = 1.0
-    status_lines: List[str] = field(default_factory=lambda: ["Ready. Configure the plotter to begin."])
+    status_lines: Deque[str] = field(
+        default_factory=lambda: collections.deque(["Ready. Configure the plotter to begin."], maxlen=200)
+    )
+    recent_status: Deque[str] = field(
+        default_factory=lambda: collections.deque(["Ready. Configure the plotter to begin."], maxlen=3)
+    )
     pots: List[Pot] = field(default_factory=list)
+    pots_by_id: Dict[int, Pot] = field(default_factory=dict)
+    pots_version: int = 0
     next_pot_id: int = 1
     selected_pot_id: Optional[int] = None
     bed_width: float = DEFAULT_BED_SIZE[0]
@@ -71,8 +144,7 @@ class PlotterState:
 
     def log(self, message: str) -> None:
         self.status_lines.append(message)
-        if len(self.status_lines) > 200:
-            del self.status_lines[: len(self.status_lines) - 200]
+        self.recent_status.append(message)
 
 
 class PlotterApp:
@@ -103,10 +175,32 @@ class PlotterApp:
         self.canvas_size = (700, 600)
         self.canvas_margin = 32
         self._last_pointer_pos: Optional[Tuple[float, float]] = None
+        self._pending_world: Optional[Tuple[float, float]] = None
+        self._pick_index: Optional[Dict[Tuple[int, int], List[Tuple[int, str, Union[str, int], float, float, float]]]] = None
+        self._pick_dirty = True
+        self._drag_handlers: Dict[str, Callable[[Any, float, float], None]] = {
+            "corner": self._update_corner_position,
+            "pot": self._update_pot_position,
+        }
+        self._drag_dirty = False
+        self._drag_flush_scheduled = False
+        self._pending_updates: set[str] = set()
+        self._flush_scheduled = False
+        self._client = None  # page client for one-shot flushes, set once the canvas is built
+        self._render_cache_key: Optional[Tuple[Any, ...]] = None
+        self._render_cache_svg: str = ""
+        self._render_cache_geometry: Dict[str, Dict[str, str]] = {}
+        self._last_canvas_hash: Optional[int] = None
+        self._canvas_structure: Optional[Tuple[Any, ...]] = None
+        self._transform_cache: Optional[Tuple[Tuple[Any, ...], Tuple[float, float, float]]] = None
+        self._jog_layout_cache: Optional[Tuple[Tuple[Any, ...], List[JogButton]]] = None
+        self._grid_cache: Optional[Tuple[Tuple[Any, ...], Tuple[str, str, Tuple[float, float, float, float]]]] = None
+        self._canvas_attrs: Dict[str, Dict[str, str]] = {}
         self.z_slider = None
         self._suppress_height_event = False
         self._suppress_color_event = False
         self.area_label = None
+        self.selection_label = None
         self._suppress_pot_event = False
         self.show_area_overlay = True
         self.show_pattern_overlay = True
@@ -117,7 +211,13 @@ class PlotterApp:
         self.status_summary = None
         self.status_summary_label = None
         self.recent_status_container = None
+        self._recent_labels: List[ui.label] = []
+        self._pots_options_cache: Optional[Tuple[int, Dict[str, str]]] = None
+        self._last_summary = ""
+        self._last_selection_text = ""
+        self._last_area_text = ""
         self.pattern = Pattern()
+        self._pattern_revision = 0
         self.pattern_name: str = "Empty"
         self.pattern_summary_label = None
         self.pattern_script_area = None
@@ -192,6 +292,9 @@ class PlotterApp:
         height = max(10.0, float(height))
         self.state.bed_width = width
         self.state.bed_height = height
+        self._grid_cache = None
+        self._transform_cache = None
+        self._pick_dirty = True
 
     def _initialize_default_rectangle(self) -> None:
         rect_width, rect_height = DEFAULT_RECT_SIZE
@@ -201,6 +304,7 @@ class PlotterApp:
         min_y = max(0.0, (self.state.bed_height - rect_height) / 2.0)
         self.state.rect_min = (min_x, min_y)
         self.state.rect_max = (min_x + rect_width, min_y + rect_height)
+        self._pick_dirty = True
         self.state.log(
             f"Initial work area set to {rect_width:.0f} × {rect_height:.0f} mm within bed "
             f"{self.state.bed_width:.0f} × {self.state.bed_height:.0f} mm."
@@ -238,6 +342,9 @@ class PlotterApp:
         if entity is None:
             return None
         kind, key = entity
+        # Fast path: entities built by this class are already canonical.
+        if (kind == "corner" and type(key) is str) or (kind == "pot" and type(key) is int):
+            return entity
         if kind == "corner":
             return (kind, str(key))
         if kind == "pot":
@@ -253,7 +360,7 @@ class PlotterApp:
             return False
         kind, key = normalized
         if kind == "corner":
-            return key in {"BL", "TR"}
+            return key in DRAGGABLE_CORNERS
         if kind == "pot":
             return True
         return False
@@ -295,6 +402,7 @@ class PlotterApp:
             with ui.row().classes("gap-1 flex-wrap items-center text-[11px]"):
                 ui.label("Plotting bed").classes("text-[11px] font-medium")
                 self.area_label = ui.label("").classes("text-[10px] text-gray-500")
+                self._last_area_text = ""
             with ui.row().classes("gap-1 flex-wrap items-center text-[11px]"):
                 ui.label("Jog & Controls").classes("text-[10px] uppercase tracking-wide text-gray-500")
                 self._compact_button("Home", lambda: self._spawn(self._home_axes()))
@@ -303,17 +411,31 @@ class PlotterApp:
                 self.area_toggle = self._toggle_button("Area", self._toggle_area, self.show_area_overlay)
                 self.pattern_toggle = self._toggle_button("Pattern", self._toggle_pattern, self.show_pattern_overlay)
                 self.pots_toggle = self._toggle_button("Pots", self._toggle_pots, self.show_pots_overlay)
+            content = self._render_canvas()
+            self._last_canvas_hash = hash(content)
+            self._canvas_attrs = dict(self._render_cache_geometry)
+            self._canvas_structure = self._canvas_structure_key()
             self.canvas = ui.html(
-                content=self._render_canvas(),
+                content=content,
                 sanitize=False,
             ).classes("rounded-lg border bg-slate-50 w-full").style(
                 f"width:100%; aspect-ratio:{self.state.bed_width}/{self.state.bed_height};"
                 "touch-action:none;cursor:crosshair;"
             )
             self.canvas.on("pointerdown", self._handle_canvas_pointer_down)
-            self.canvas.on("pointermove", self._handle_canvas_pointer_move)
+            # Only forward moves while a drag is active; idle hovering never reaches the server.
+            self.canvas.on(
+                "pointermove",
+                self._handle_canvas_pointer_move,
+                js_handler=(
+                    "(e) => { if (window.__plotterDragging && e.buttons) "
+                    "emit({offsetX: e.offsetX, offsetY: e.offsetY, buttons: e.buttons}); }"
+                ),
+            )
             self.canvas.on("pointerup", self._handle_canvas_pointer_up)
             self.canvas.on("pointerleave", self._handle_canvas_pointer_up)
+            # Pointer moves only record the latest position; _flush_drag applies it at ~60 Hz.
+            self._client = ui.context.client
             with ui.row().classes("mt-1 gap-1 text-[10px] text-gray-500"):
                 ui.icon("touch_app").classes("text-primary")
                 ui.label("Click to jog corners or drag handles to reshape the work area.")
@@ -324,13 +446,17 @@ class PlotterApp:
                 self.status_summary_label = ui.label(
                     "Connected | COM3 @ 115200 | X=0.0 | Y=0.0 | Z=0.00 | Idle"
                 ).classes("text-[11px] font-medium text-gray-800")
+                self._last_summary = self.status_summary_label.text
 
             with ui.card().classes("p-2 gap-2"):
                 ui.label("Selection").classes("text-[11px] font-medium text-gray-600")
                 self.selection_label = ui.label("No selection").classes("text-[11px] text-gray-700")
+                self._last_selection_text = "No selection"
                 ui.separator()
                 ui.label("Recent activity").classes("text-[11px] font-medium text-gray-600")
                 self.recent_status_container = ui.column().classes("gap-1 text-[11px] text-gray-700")
+                with self.recent_status_container:
+                    self._recent_labels = [ui.label("").classes("text-xs text-gray-700") for _ in range(3)]
                 self._update_status_panels()
 
     def _build_control_tabs(self) -> None:
@@ -741,7 +867,7 @@ class PlotterApp:
     def _schedule_pen_height(self, pos: float) -> None:
         if not self._require_grbl(alert=False):
             return
-        self._pending_pen_value = float(max(0.0, min(1.0, pos)))
+        self._pending_pen_value = float(_clamp(pos, 0.0, 1.0))
         if self._pending_pen_task is None:
             self._pending_pen_task = asyncio.create_task(self._flush_pending_pen())
 
@@ -763,12 +889,12 @@ class PlotterApp:
             lambda g: g.pen_set(pos, step=0.05, step_delay_s=0.02, wait=False),
             alert=alert,
         )
-        self._active_pen_height = float(max(0.0, min(1.0, pos)))
+        self._active_pen_height = float(_clamp(pos, 0.0, 1.0))
 
     async def _pen_button_action(self, target: float) -> None:
         if not self._require_grbl(alert=True):
             return
-        target = float(max(0.0, min(1.0, target)))
+        target = float(_clamp(target, 0.0, 1.0))
         await self._set_pen_height(target, alert=False)
         self._log_status(f"Pen moved to {target:.2f} height.")
 
@@ -811,9 +937,7 @@ class PlotterApp:
             )
 
     def _connect_grbl_sync(self, port: str) -> GRBL:
-        cfg_data = vars(self.grbl_config).copy()
-        cfg_data["port"] = port
-        cfg = Config(**cfg_data)
+        cfg = replace(self.grbl_config, port=port)
         grbl = GRBL(cfg).connect()
         return grbl
 
@@ -893,6 +1017,15 @@ class PlotterApp:
             self.gcode_input.value = ""
 
     def _canvas_transform(self) -> Tuple[float, float, float]:
+        # Cached until the bed size changes (_apply_bed_size) or the canvas is resized.
+        cached = self._transform_cache
+        if cached is not None and cached[0] == (self.canvas_size, self.canvas_margin):
+            return cached[1]
+        transform = self._compute_canvas_transform()
+        self._transform_cache = ((self.canvas_size, self.canvas_margin), transform)
+        return transform
+
+    def _compute_canvas_transform(self) -> Tuple[float, float, float]:
         inner_width = self.canvas_size[0] - 2 * self.canvas_margin
         inner_height = self.canvas_size[1] - 2 * self.canvas_margin
         if self.state.bed_width <= 0 or self.state.bed_height <= 0:
@@ -918,8 +1051,8 @@ class PlotterApp:
             return 0.0, 0.0
         x = (cx - offset_x) / scale
         y = (self.canvas_size[1] - cy - offset_y) / scale
-        x = max(0.0, min(self.state.bed_width, x))
-        y = max(0.0, min(self.state.bed_height, y))
+        x = _clamp(x, 0.0, self.state.bed_width)
+        y = _clamp(y, 0.0, self.state.bed_height)
         return x, y
 
     def _corner_world_coords(self, key: str) -> Tuple[float, float]:
@@ -933,94 +1066,121 @@ class PlotterApp:
         }
         return positions[key]
 
-    def _render_canvas(self) -> str:
-        width, height = self.canvas_size
+    def _canvas_structure_key(self) -> Tuple[Any, ...]:
+        """Everything the canvas SVG depends on apart from draggable positions."""
+        return (
+            self.canvas_size,
+            self.state.bed_width,
+            self.state.bed_height,
+            self.state.selected_entity,
+            self.show_area_overlay,
+            self.show_pattern_overlay,
+            self.show_pots_overlay,
+            tuple(self.state.corner_heights.items()),
+            tuple((pot.identifier, pot.color) for pot in self.state.pots),
+            self._pattern_revision,
+            self.preview_pen_choice,
+            self.pattern_display_width,
+        )
+
+    def _canvas_render_key(self) -> Tuple[Any, ...]:
+        """Everything the canvas SVG depends on, as a hashable tuple."""
+        return (
+            self._canvas_structure_key(),
+            self.state.rect_min,
+            self.state.rect_max,
+            tuple(pot.position for pot in self.state.pots),
+        )
+
+    def _canvas_geometry(self) -> Dict[str, Dict[str, str]]:
+        """Formatted coordinates of every canvas element that moves while dragging, keyed by SVG id."""
+        geometry: Dict[str, Dict[str, str]] = {}
+        selected = self.state.selected_entity
+        scale, offset_x, offset_y = self._canvas_transform()
+        canvas_height = self.canvas_size[1]
+        if self.show_area_overlay:
+            rect_left, rect_bottom = self._world_to_canvas(*self.state.rect_min)
+            rect_right, rect_top = self._world_to_canvas(*self.state.rect_max)
+            geometry["rect-work"] = {
+                "x": f"{rect_left:.1f}",
+                "y": f"{rect_top:.1f}",
+                "width": f"{max(1.0, rect_right - rect_left):.1f}",
+                "height": f"{max(1.0, rect_bottom - rect_top):.1f}",
+            }
+            for key in CORNER_KEYS:
+                wx, wy = self._corner_world_coords(key)
+                cx = offset_x + wx * scale
+                cy = canvas_height - (offset_y + wy * scale)
+                label_dx, label_dy = LABEL_OFFSETS[key]
+                center = {"cx": f"{cx:.1f}", "cy": f"{cy:.1f}"}
+                geometry[f"corner-{key}"] = center
+                geometry[f"corner-{key}-dot"] = dict(center)
+                geometry[f"corner-{key}-label"] = {"x": f"{cx + label_dx:.1f}", "y": f"{cy + label_dy:.1f}"}
+        if self.show_pots_overlay:
+            for pot in self.state.pots:
+                wx, wy = pot.position
+                px = offset_x + wx * scale
+                py = canvas_height - (offset_y + wy * scale)
+                radius = 12 if selected == ("pot", pot.identifier) else 10
+                geometry[f"pot-{pot.identifier}"] = {"cx": f"{px:.1f}", "cy": f"{py:.1f}"}
+                geometry[f"pot-{pot.identifier}-label"] = {"x": f"{px:.1f}", "y": f"{py + radius + 14:.1f}"}
+        for index, btn in enumerate(self._jog_button_layout(selected)):
+            geometry[f"jog-{index}"] = {"x": f"{btn.x:.1f}", "y": f"{btn.y:.1f}"}
+            geometry[f"jog-{index}-label"] = {
+                "x": f"{btn.x + btn.width / 2:.1f}",
+                "y": f"{btn.y + btn.height / 2:.1f}",
+            }
+        return geometry
+
+    def _build_grid_svg(self) -> Tuple[str, str, Tuple[float, float, float, float]]:
+        """Return the bed grid lines and bed rectangle, rebuilt only when the bed or canvas size changes."""
+        key = (self.state.bed_width, self.state.bed_height, self.canvas_size, self.canvas_margin)
+        if self._grid_cache is not None and self._grid_cache[0] == key:
+            return self._grid_cache[1]
         bed_left, bed_bottom = self._world_to_canvas(0.0, 0.0)
         bed_right, _ = self._world_to_canvas(self.state.bed_width, 0.0)
         _, bed_top = self._world_to_canvas(0.0, self.state.bed_height)
         bed_width_px = max(1.0, bed_right - bed_left)
         bed_height_px = max(1.0, bed_bottom - bed_top)
 
+        scale, offset_x, offset_y = self._canvas_transform()
+        canvas_height = self.canvas_size[1]
         vertical_lines = []
         tick = 50.0
-        x = 0.0
-        while x <= self.state.bed_width + 1e-6:
-            cx, _ = self._world_to_canvas(x, 0.0)
+        for i in range(int(self.state.bed_width // tick) + 1):
+            cx = offset_x + i * tick * scale
             vertical_lines.append(
                 f'<line x1="{cx:.1f}" y1="{bed_top:.1f}" '
                 f'x2="{cx:.1f}" y2="{bed_bottom:.1f}" />'
             )
-            x += tick
 
         horizontal_lines = []
-        y = 0.0
-        while y <= self.state.bed_height + 1e-6:
-            _, cy = self._world_to_canvas(0.0, y)
+        for i in range(int(self.state.bed_height // tick) + 1):
+            cy = canvas_height - (offset_y + i * tick * scale)
             horizontal_lines.append(
                 f'<line x1="{bed_left:.1f}" y1="{cy:.1f}" x2="{bed_right:.1f}" y2="{cy:.1f}" />'
             )
-            y += tick
 
-        rect_items: List[str] = []
-        corner_items: List[str] = []
-        if self.show_area_overlay:
-            rect_min_x, rect_min_y = self.state.rect_min
-            rect_max_x, rect_max_y = self.state.rect_max
-            rect_left, rect_bottom = self._world_to_canvas(rect_min_x, rect_min_y)
-            rect_right, rect_top = self._world_to_canvas(rect_max_x, rect_max_y)
-            rect_x = rect_left
-            rect_y = rect_top
-            rect_width = max(1.0, rect_right - rect_left)
-            rect_height = max(1.0, rect_bottom - rect_top)
-            rect_items.append(
-                f'<rect x="{rect_x:.1f}" y="{rect_y:.1f}" width="{rect_width:.1f}" height="{rect_height:.1f}" '
-                f'fill="rgba(37, 99, 235, 0.08)" stroke="#2563eb" stroke-width="2" />'
-            )
+        grid = ("".join(vertical_lines), "".join(horizontal_lines), (bed_left, bed_top, bed_width_px, bed_height_px))
+        self._grid_cache = (key, grid)
+        return grid
 
-        label_offsets = {
-            "BL": (-16, 20),
-            "BR": (16, 20),
-            "TL": (-16, -16),
-            "TR": (16, -16),
-        }
+    def _render_canvas(self) -> str:
+        # Pointer moves that do not change any geometry (hover jitter, drags
+        # clamped at the bed edge) reuse the previous SVG instead of rebuilding it.
+        cache_key = self._canvas_render_key()
+        if cache_key == self._render_cache_key:
+            return self._render_cache_svg
+        width, height = self.canvas_size
+        vertical_lines, horizontal_lines, bed_rect = self._build_grid_svg()
+        geometry = self._canvas_geometry()
         selected = self.state.selected_entity
-        if self.show_area_overlay:
-            for key in ["BL", "BR", "TL", "TR"]:
-                cx, cy = self._world_to_canvas(*self._corner_world_coords(key))
-                is_selected = selected == ("corner", key)
-                corner_items.append(
-                    f'<g>'
-                    f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{10 if is_selected else 8}" '
-                    f'stroke="#2563eb" stroke-width="{3 if is_selected else 2}" fill="#fff" />'
-                    f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{4}" fill="#2563eb" />'
-                    f'</g>'
-                )
-                offset_x, offset_y = label_offsets[key]
-                label_x = cx + offset_x
-                label_y = cy + offset_y
-                corner_items.append(
-                    f'<text x="{label_x:.1f}" y="{label_y:.1f}" '
-                    f'font-size="12" text-anchor="middle" fill="#1f2937">{self.state.corner_heights[key]:.2f}</text>'
-                )
 
-        pot_items = []
-        if self.show_pots_overlay:
-            for pot in self.state.pots:
-                px, py = self._world_to_canvas(*pot.position)
-                is_selected = selected == ("pot", pot.identifier)
-                radius = 12 if is_selected else 10
-                pot_items.append(
-                    f'<g>'
-                    f'<circle cx="{px:.1f}" cy="{py:.1f}" r="{radius}" fill="{pot.color}" '
-                    f'stroke="#1f2937" stroke-width="{2 if is_selected else 1.5}" />'
-                    f'<text x="{px:.1f}" y="{py + radius + 14:.1f}" font-size="11" '
-                    f'text-anchor="middle" fill="#1f2937">Pot {pot.identifier}</text>'
-                    f'</g>'
-                )
-
-        pattern_items: List[str] = []
+        parts: List[str] = []
         if self.show_pattern_overlay and self.pattern.items:
             pen_filter = self.preview_pen_choice if getattr(self, "preview_pen_choice", None) else "all"
+            scale, offset_x, offset_y = self._canvas_transform()
+            canvas_height = self.canvas_size[1]
             for item in self.pattern.items:
                 if isinstance(item, Polyline):
                     pts = list(reversed(item.pts)) if item._rev else list(item.pts)
@@ -1035,50 +1195,81 @@ class PlotterApp:
                 pen_id = getattr(item, "pen_id", 0)
                 if pen_filter != "all" and str(pen_id) != str(pen_filter):
                     continue
-                canvas_pts = [self._world_to_canvas(px, py) for px, py in pts]
-                points_attr = " ".join(f"{cx:.1f},{cy:.1f}" for cx, cy in canvas_pts)
-                color = DEFAULT_PEN_COLORS.get(getattr(item, "pen_id", 0), "#2563eb")
-                pattern_items.append(
-                    f'<polyline points="{points_attr}" class="pattern-stroke" stroke="{color}" stroke-width="{self.pattern_display_width}" />'
+                points_attr = " ".join(
+                    "%.1f,%.1f" % (offset_x + px * scale, canvas_height - (offset_y + py * scale)) for px, py in pts
+                )
+                color = DEFAULT_PEN_COLORS.get(pen_id, "#2563eb")
+                parts.append(
+                    '<polyline points="%s" class="pattern-stroke" stroke="%s" stroke-width="%s" />'
+                    % (points_attr, color, self.pattern_display_width)
                 )
 
-        jog_items = []
-        jog_layout = self._jog_button_layout(selected)
-        for btn in jog_layout:
-            x = float(btn["x"])
-            y = float(btn["y"])
-            btn_width = float(btn["width"])
-            btn_height = float(btn["height"])
-            label = btn["label"]
-            jog_items.append(
-                f'<g>'
-                f'<rect x="{x:.1f}" y="{y:.1f}" width="{btn_width:.1f}" height="{btn_height:.1f}" '
-                f'rx="4" ry="4" fill="#e2e8f0" stroke="#475569" stroke-width="1" />'
-                f'<text x="{x + btn_width / 2:.1f}" y="{y + btn_height / 2:.1f}" font-size="11" '
-                f'text-anchor="middle" dominant-baseline="middle" fill="#1f2937">{label}</text>'
-                f'</g>'
+        if self.show_area_overlay:
+            rect = geometry["rect-work"]
+            parts.append(
+                '<rect id="rect-work" x="%s" y="%s" width="%s" height="%s" '
+                'fill="rgba(37, 99, 235, 0.08)" stroke="#2563eb" stroke-width="2" />'
+                % (rect["x"], rect["y"], rect["width"], rect["height"])
             )
+            for key in CORNER_KEYS:
+                center = geometry[f"corner-{key}"]
+                label = geometry[f"corner-{key}-label"]
+                is_selected = selected == ("corner", key)
+                parts.append(
+                    '<g><circle id="corner-%s" cx="%s" cy="%s" r="%d" stroke="#2563eb" stroke-width="%d" fill="#fff" />'
+                    '<circle id="corner-%s-dot" cx="%s" cy="%s" r="4" fill="#2563eb" /></g>'
+                    % (
+                        key, center["cx"], center["cy"], 10 if is_selected else 8, 3 if is_selected else 2,
+                        key, center["cx"], center["cy"],
+                    )
+                )
+                parts.append(
+                    '<text id="corner-%s-label" x="%s" y="%s" font-size="12" text-anchor="middle" fill="#1f2937">%.2f</text>'
+                    % (key, label["x"], label["y"], self.state.corner_heights[key])
+                )
 
-        svg = f"""
-        <svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg" style="user-select:none;">
-          <defs>
-            <style>
-              .grid-line {{ stroke: #d1d5db; stroke-width: 1; }}
-              .pattern-stroke {{ fill: none; stroke-linecap: round; stroke-linejoin: round; }}
-            </style>
-          </defs>
-          <rect x="{bed_left:.1f}" y="{bed_top:.1f}" width="{bed_width_px:.1f}" height="{bed_height_px:.1f}" fill="#f8fafc" stroke="#4b5563" stroke-width="2" rx="12" />
-          <g class="grid-line">
-            {''.join(vertical_lines)}
-            {''.join(horizontal_lines)}
-          </g>
-          {''.join(pattern_items)}
-          {''.join(rect_items)}
-          {''.join(corner_items)}
-          {''.join(pot_items)}
-          {''.join(jog_items)}
-        </svg>
-        """
+        if self.show_pots_overlay:
+            for pot in self.state.pots:
+                center = geometry[f"pot-{pot.identifier}"]
+                label = geometry[f"pot-{pot.identifier}-label"]
+                is_selected = selected == ("pot", pot.identifier)
+                parts.append(
+                    '<g><circle id="pot-%d" cx="%s" cy="%s" r="%d" fill="%s" stroke="#1f2937" stroke-width="%s" />'
+                    '<text id="pot-%d-label" x="%s" y="%s" font-size="11" text-anchor="middle" fill="#1f2937">Pot %d</text></g>'
+                    % (
+                        pot.identifier, center["cx"], center["cy"], 12 if is_selected else 10, pot.color,
+                        2 if is_selected else 1.5, pot.identifier, label["x"], label["y"], pot.identifier,
+                    )
+                )
+
+        for index, btn in enumerate(self._jog_button_layout(selected)):
+            corner = geometry[f"jog-{index}"]
+            center = geometry[f"jog-{index}-label"]
+            parts.append(
+                '<g><rect id="jog-%d" x="%s" y="%s" width="%.1f" height="%.1f" '
+                'rx="4" ry="4" fill="#e2e8f0" stroke="#475569" stroke-width="1" />'
+                '<text id="jog-%d-label" x="%s" y="%s" font-size="11" '
+                'text-anchor="middle" dominant-baseline="middle" fill="#1f2937">%s</text></g>'
+                % (
+                    index, corner["x"], corner["y"], btn.width, btn.height,
+                    index, center["x"], center["y"], btn.label,
+                )
+            )
+
+        bed_left, bed_top, bed_w_px, bed_h_px = bed_rect
+        svg = SVG_SHELL.format(
+            width=width,
+            height=height,
+            bed_left=bed_left,
+            bed_top=bed_top,
+            bed_w_px=bed_w_px,
+            bed_h_px=bed_h_px,
+            grid=vertical_lines + horizontal_lines,
+            body="".join(parts),
+        )
+        self._render_cache_key = cache_key
+        self._render_cache_svg = svg
+        self._render_cache_geometry = geometry
         return svg
 
     def _get_entity_canvas_position(
@@ -1097,7 +1288,7 @@ class PlotterApp:
         if kind == "pot":
             if not self.show_pots_overlay:
                 return None
-            pot = next((p for p in self.state.pots if p.identifier == key), None)
+            pot = self.state.pots_by_id.get(key)
             if pot is None:
                 return None
             px, py = self._world_to_canvas(*pot.position)
@@ -1105,7 +1296,7 @@ class PlotterApp:
             return px, py, radius
         return None
 
-    def _jog_button_layout(self, entity: Optional[Tuple[str, Union[str, int]]]) -> List[Dict[str, float | str]]:
+    def _jog_button_layout(self, entity: Optional[Tuple[str, Union[str, int]]]) -> List[JogButton]:
         if not self._is_entity_draggable(entity):
             return []
         if isinstance(entity, tuple):
@@ -1116,6 +1307,10 @@ class PlotterApp:
         position = self._get_entity_canvas_position(entity)
         if position is None:
             return []
+        # The layout only moves with the entity, so reuse it between renders and hit tests.
+        cache_key = (entity, position)
+        if self._jog_layout_cache is not None and self._jog_layout_cache[0] == cache_key:
+            return self._jog_layout_cache[1]
         base_x, base_y, radius = position
         btn_size = 14.0
         gap = 1.0
@@ -1133,20 +1328,10 @@ class PlotterApp:
         left_near_x = base_x - first_offset - btn_size
         left_far_x = left_near_x - (btn_size + gap)
 
-        layout: List[Dict[str, float | str]] = []
+        layout: List[JogButton] = []
 
         def add_button(x: float, y: float, label: str, dx: float, dy: float) -> None:
-            layout.append(
-                {
-                    "x": x,
-                    "y": y,
-                    "width": btn_size,
-                    "height": btn_size,
-                    "label": label,
-                    "dx": dx,
-                    "dy": dy,
-                }
-            )
+            layout.append(JogButton(x, y, btn_size, btn_size, label, dx, dy))
 
         # Up (+Y)
         add_button(base_x - btn_size / 2, up_near_y, "+", 0.0, +0.1)
@@ -1161,40 +1346,104 @@ class PlotterApp:
         add_button(left_near_x, base_y - btn_size / 2, "-", -0.1, 0.0)
         add_button(left_far_x, base_y - btn_size / 2, "--", -1.0, 0.0)
 
+        self._jog_layout_cache = (cache_key, layout)
         return layout
 
-    def _update_canvas(self) -> None:
+    def _update_canvas(self, geometry_only: bool = False) -> None:
+        """Refresh the canvas, patching element positions in place when only geometry changed."""
         if self.canvas is not None:
-            self.canvas.set_content(self._render_canvas())
+            if geometry_only and self._canvas_structure_key() == self._canvas_structure:
+                self._patch_canvas(self._canvas_geometry())
+            else:
+                svg = self._render_canvas()
+                # set_content always ships the full string; skip it when nothing changed.
+                # str caches its hash, so repeated checks against the cached SVG are free.
+                svg_hash = hash(svg)
+                if svg_hash != self._last_canvas_hash:
+                    self.canvas.set_content(svg)
+                    self._last_canvas_hash = svg_hash
+                    self._canvas_attrs = dict(self._render_cache_geometry)
+                else:
+                    # The DOM may have been patched since this SVG was sent.
+                    self._patch_canvas(self._render_cache_geometry)
+                self._canvas_structure = self._canvas_structure_key()
         self._update_area_label()
 
+    def _patch_canvas(self, geometry: Dict[str, Dict[str, str]]) -> None:
+        """Send only the changed element attributes to the browser."""
+        updates: Dict[str, Dict[str, str]] = {}
+        for element_id, attrs in geometry.items():
+            shown = self._canvas_attrs.get(element_id, {})
+            changed = {name: value for name, value in attrs.items() if shown.get(name) != value}
+            if changed:
+                updates[element_id] = changed
+                self._canvas_attrs[element_id] = attrs
+        if not updates:
+            return
+        ui.run_javascript(
+            f"for (const [id, attrs] of Object.entries({json.dumps(updates)})) {{"
+            " const el = document.getElementById(id);"
+            " if (el) for (const [name, value] of Object.entries(attrs)) el.setAttribute(name, value);"
+            " }"
+        )
+
     def _hit_test_canvas(self, cx: float, cy: float) -> Optional[Tuple[str, Union[str, int]]]:
-        if self.show_area_overlay:
-            for key in ["BL", "BR", "TL", "TR"]:
-                hx, hy = self._world_to_canvas(*self._corner_world_coords(key))
-                if math.hypot(cx - hx, cy - hy) <= 14:
-                    return ("corner", key)
-        if self.show_pots_overlay:
-            for pot in reversed(self.state.pots):
-                px, py = self._world_to_canvas(*pot.position)
-                if math.hypot(cx - px, cy - py) <= 16:
-                    return ("pot", pot.identifier)
-        return None
+        if self._pick_dirty or self._pick_index is None:
+            self._rebuild_pick_index()
+        # Work in "flipped" canvas y so world coordinates map with one multiply-add.
+        fy = self.canvas_size[1] - cy
+        col = math.floor(cx / PICK_CELL_SIZE)
+        row = math.floor(fy / PICK_CELL_SIZE)
+        best: Optional[Tuple[int, str, Union[str, int]]] = None
+        for bucket_col in (col - 1, col, col + 1):
+            for bucket_row in (row - 1, row, row + 1):
+                for rank, kind, key, hx, hy, radius in self._pick_index.get((bucket_col, bucket_row), ()):
+                    if best is not None and rank >= best[0]:
+                        continue
+                    if kind == "corner" and not self.show_area_overlay:
+                        continue
+                    if kind == "pot" and not self.show_pots_overlay:
+                        continue
+                    dx = cx - hx
+                    dy = fy - hy
+                    if dx * dx + dy * dy <= radius * radius:
+                        best = (rank, kind, key)
+        if best is None:
+            return None
+        return (best[1], best[2])
+
+    def _rebuild_pick_index(self) -> None:
+        """Bucket corner and pot handles into a PICK_CELL_SIZE grid in flipped canvas space.
+
+        Each entry carries a rank reproducing the old scan order: corners first, then
+        pots from most recently added, so overlapping handles resolve as before.
+        """
+        scale, offset_x, offset_y = self._canvas_transform()
+        entries: List[Tuple[int, str, Union[str, int], float, float, float]] = []
+        for rank, key in enumerate(CORNER_KEYS):
+            hx, hy = self._corner_world_coords(key)
+            entries.append((rank, "corner", key, offset_x + hx * scale, offset_y + hy * scale, 14.0))
+        base_rank = len(CORNER_KEYS) + len(self.state.pots) - 1
+        for index, pot in enumerate(self.state.pots):
+            px, py = pot.position
+            entries.append((base_rank - index, "pot", pot.identifier, offset_x + px * scale, offset_y + py * scale, 16.0))
+        index_map: Dict[Tuple[int, int], List[Tuple[int, str, Union[str, int], float, float, float]]] = {}
+        for entry in entries:
+            cell = (math.floor(entry[3] / PICK_CELL_SIZE), math.floor(entry[4] / PICK_CELL_SIZE))
+            index_map.setdefault(cell, []).append(entry)
+        self._pick_index = index_map
+        self._pick_dirty = False
 
     def _hit_test_jog(self, cx: float, cy: float) -> Optional[Dict[str, Union[float, Tuple[str, Union[str, int]]]]]:
         selected = self.state.selected_entity
         if not self._is_entity_draggable(selected):
             return None
         for btn in self._jog_button_layout(selected):
-            x = float(btn["x"])
-            y = float(btn["y"])
-            width = float(btn["width"])
-            height = float(btn["height"])
-            if x <= cx <= x + width and y <= cy <= y + height:
+            if btn.x <= cx <= btn.x + btn.width and btn.y <= cy <= btn.y + btn.height:
                 return {
                     "entity": self._normalize_entity(selected),
-                    "dx": float(btn["dx"]),
-                    "dy": float(btn["dy"]),
+                    "dx": btn.dx,
+                    "dy": btn.dy,
                 }
         return None
 
@@ -1240,6 +1489,9 @@ class PlotterApp:
             self.state.drag_has_moved = False
             self._last_pointer_pos = (cx, cy)
             self.state.drag_arm = None
+            self._pending_world = None
+            self._drag_dirty = False
+            self._set_client_dragging(True)
             self._enter_safe_pen_mode()
         else:
             self.state.drag_entity = None
@@ -1254,16 +1506,76 @@ class PlotterApp:
             return
         cx = float(data.get("offsetX", 0.0))
         cy = float(data.get("offsetY", 0.0))
-        if self._last_pointer_pos:
+        if self._last_pointer_pos and not self.state.drag_has_moved:
             if math.hypot(cx - self._last_pointer_pos[0], cy - self._last_pointer_pos[1]) > 2:
                 self.state.drag_has_moved = True
         self._last_pointer_pos = (cx, cy)
-        wx, wy = self._canvas_to_world(cx, cy)
-        self._apply_drag(wx, wy)
+        self._pending_world = self._canvas_to_world(cx, cy)
+        self._drag_dirty = True
+        if not self._drag_flush_scheduled:
+            self._drag_flush_scheduled = True
+            if not self._call_later(0.016, self._flush_drag):
+                self._flush_drag()
+
+    def _call_later(self, delay: float, callback: Callable[[], None]) -> bool:
+        """Run ``callback`` once after ``delay`` s in this page's context; False before the page is built.
+
+        The coalescing flushes use this instead of a deactivated ui.timer, which
+        would still wake up every interval for as long as the page is open.
+        """
+        client = self._client
+        if client is None:
+            return False
+
+        def run() -> None:
+            if client.is_deleted:
+                return
+            with client:
+                callback()
+
+        asyncio.get_running_loop().call_later(delay, run)
+        return True
+
+    def _schedule_update(self, *kinds: str) -> None:
+        """Queue "canvas", "selection", "summary" or "recent" refreshes so a burst of handlers runs each once."""
+        self._pending_updates.update(kinds)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            if not self._call_later(0.016, self._flush_updates):
+                self._flush_updates()
+
+    def _flush_updates(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending_updates = self._pending_updates, set()
+        if "selection" in pending:
+            self._update_selection_label()
+        if "canvas" in pending:
+            self._update_canvas()
+        if "summary" in pending:
+            self._update_status_summary()
+        if "recent" in pending:
+            self._update_recent_status()
+
+    def _set_client_dragging(self, dragging: bool) -> None:
+        if self.canvas is not None:
+            ui.run_javascript(f"window.__plotterDragging = {'true' if dragging else 'false'};")
+
+    def _flush_drag(self) -> None:
+        self._drag_flush_scheduled = False
+        if not self._drag_dirty or self._pending_world is None:
+            return
+        self._drag_dirty = False
+        self._apply_drag(*self._pending_world)
 
     def _handle_canvas_pointer_up(self, _: events.GenericEventArguments) -> None:
         if not self.state.drag_entity:
             return
+        self._set_client_dragging(False)
+        # Apply the final position so the drop point matches the last pointer event.
+        self._flush_drag()
+        self._pending_world = None
+        # Resync the element's server-side content with the patched DOM.
+        self._update_canvas()
         if not self.state.drag_has_moved:
             self._handle_click_action(self.state.drag_entity)
         self.state.drag_entity = None
@@ -1277,7 +1589,7 @@ class PlotterApp:
             x, y = self._corner_world_coords(key)
             self._log_status(f"Jogging to corner {key} at ({x:.1f}, {y:.1f}).")
         elif kind == "pot":
-            pot = next((p for p in self.state.pots if p.identifier == key), None)
+            pot = self.state.pots_by_id.get(key)
             if pot:
                 x, y = pot.position
                 self._log_status(f"Jogging to pot #{pot.identifier} at ({x:.1f}, {y:.1f}).")
@@ -1291,9 +1603,9 @@ class PlotterApp:
             return None
         kind, key = normalized
         if kind == "corner":
-            return self._corner_world_coords(str(key))
+            return self._corner_world_coords(key)
         if kind == "pot":
-            pot = next((p for p in self.state.pots if p.identifier == int(key)), None)
+            pot = self.state.pots_by_id.get(key)
             if pot:
                 return pot.position
         return None
@@ -1311,67 +1623,74 @@ class PlotterApp:
                 min_y = min(max(min_y + dy, 0.0), max_y - 1.0)
                 self.state.rect_min = (min_x, min_y)
             elif key == "TR":
-                max_x = max(min(max_x + dx, self.state.bed_width), min_x + 1.0)
-                max_y = max(min(max_y + dy, self.state.bed_height), min_y + 1.0)
+                max_x = _clamp(max_x + dx, min_x + 1.0, self.state.bed_width)
+                max_y = _clamp(max_y + dy, min_y + 1.0, self.state.bed_height)
                 self.state.rect_max = (max_x, max_y)
             else:
                 return
+            self._pick_dirty = True
             self._log_status(f"Jogged corner {key} by ({dx:+.2f}, {dy:+.2f}).")
         elif kind == "pot":
-            pot = next((p for p in self.state.pots if p.identifier == key), None)
+            pot = self.state.pots_by_id.get(key)
             if pot is None:
                 return
-            new_x = max(0.0, min(self.state.bed_width, pot.position[0] + dx))
-            new_y = max(0.0, min(self.state.bed_height, pot.position[1] + dy))
+            new_x = _clamp(pot.position[0] + dx, 0.0, self.state.bed_width)
+            new_y = _clamp(pot.position[1] + dy, 0.0, self.state.bed_height)
             pot.position = (new_x, new_y)
+            self._pick_dirty = True
             self._log_status(f"Jogged pot #{pot.identifier} to ({new_x:.1f}, {new_y:.1f}).")
         pos = self._entity_world_position((kind, key))
         if pos is not None:
             self._schedule_position_move(*pos, alert=False, safe=False)
-        self._update_canvas()
-        self._update_selection_label()
+        self._schedule_update("canvas", "selection")
 
     def _apply_drag(self, x: float, y: float) -> None:
-        if not self.state.drag_entity:
+        entity = self.state.drag_entity
+        if not entity:
             return
-        if not self._is_entity_draggable(self.state.drag_entity):
+        # drag_entity is only set for draggable, normalized entities (see pointer down).
+        kind, key = entity
+        handler = self._drag_handlers.get(kind)
+        if handler is None:
             return
-        kind, key = self.state.drag_entity
-        if kind == "corner":
-            self._update_corner_position(str(key), x, y)
-        elif kind == "pot":
-            self._update_pot_position(int(key), x, y)
-        self._update_canvas()
+        current = self._entity_world_position(entity)
+        # Sub-0.05 mm pointer jitter would not visibly move anything; skip the redraw.
+        if current is not None and abs(x - current[0]) < 0.05 and abs(y - current[1]) < 0.05:
+            return
+        handler(key, x, y)
+        self._update_canvas(geometry_only=True)
         self._update_selection_label()
-        pos = self._entity_world_position((kind, key))
+        pos = self._entity_world_position(entity)
         if pos is not None:
             self._schedule_position_move(*pos, alert=False, safe=True)
 
     def _update_corner_position(self, key: str, x: float, y: float) -> None:
-        key = str(key)
-        if key not in {"BL", "TR"}:
+        if key not in DRAGGABLE_CORNERS:
             return
-        min_x, min_y = self.state.rect_min
-        max_x, max_y = self.state.rect_max
+        state = self.state
+        min_x, min_y = state.rect_min
+        max_x, max_y = state.rect_max
 
         if key == "BL":
             min_x = min(max(x, 0.0), max_x - 1.0)
             min_y = min(max(y, 0.0), max_y - 1.0)
         elif key == "TR":
-            max_x = max(min(x, self.state.bed_width), min_x + 1.0)
-            max_y = max(min(y, self.state.bed_height), min_y + 1.0)
+            max_x = _clamp(x, min_x + 1.0, state.bed_width)
+            max_y = _clamp(y, min_y + 1.0, state.bed_height)
 
-        self.state.rect_min = (min_x, min_y)
-        self.state.rect_max = (max_x, max_y)
+        state.rect_min = (min_x, min_y)
+        state.rect_max = (max_x, max_y)
+        self._pick_dirty = True
         self._sync_grbl_compensation()
 
     def _update_pot_position(self, identifier: int, x: float, y: float) -> None:
-        clamped_x = max(0.0, min(self.state.bed_width, x))
-        clamped_y = max(0.0, min(self.state.bed_height, y))
-        for pot in self.state.pots:
-            if pot.identifier == identifier:
-                pot.position = (clamped_x, clamped_y)
-                break
+        state = self.state
+        clamped_x = _clamp(x, 0.0, state.bed_width)
+        clamped_y = _clamp(y, 0.0, state.bed_height)
+        pot = state.pots_by_id.get(identifier)
+        if pot is not None:
+            pot.position = (clamped_x, clamped_y)
+            self._pick_dirty = True
 
     def _default_pot_position(self) -> Tuple[float, float]:
         min_x, min_y = self.state.rect_min
@@ -1381,8 +1700,8 @@ class PlotterApp:
         target_x = min_x + max(10.0, width) * 0.25
         target_y = min_y + max(10.0, height) * 0.5
         return (
-            max(0.0, min(self.state.bed_width, target_x)),
-            max(0.0, min(self.state.bed_height, target_y)),
+            _clamp(target_x, 0.0, self.state.bed_width),
+            _clamp(target_y, 0.0, self.state.bed_height),
         )
 
     def _select_entity(self, entity: Tuple[str, Union[str, int]], *, update_slider: bool = True) -> None:
@@ -1419,27 +1738,24 @@ class PlotterApp:
                         self.pot_select.value = target_value
                     finally:
                         self._suppress_pot_event = False
-            pot = next((p for p in self.state.pots if p.identifier == key), None)
+            pot = self.state.pots_by_id.get(key)
             if pot:
                 target_height = pot.height
                 if self.color_picker is not None:
-                    try:
-                        self._suppress_color_event = True
-                        self.color_picker.value = pot.color
-                    finally:
-                        self._suppress_color_event = False
+                    if self.color_picker.value != pot.color:
+                        try:
+                            self._suppress_color_event = True
+                            self.color_picker.value = pot.color
+                        finally:
+                            self._suppress_color_event = False
                     self.color_picker.enable()
             elif self.color_picker is not None:
                 self.color_picker.disable()
         elif self.color_picker is not None:
             self.color_picker.disable()
 
-        if update_slider and self.z_slider is not None:
-            try:
-                self._suppress_height_event = True
-                self.z_slider.value = target_height
-            finally:
-                self._suppress_height_event = False
+        if update_slider:
+            self._set_slider_value(target_height)
         self.state.z_height = target_height
         if kind == "corner":
             self._sync_grbl_compensation()
@@ -1486,6 +1802,7 @@ class PlotterApp:
                 with_input=False,
                 on_change=self._on_pot_selected,
             ).props("label='Pot selection' dense")
+            self._pots_options_cache = None
             ui.label("Pots appear as overlay circles with their configured colors.").classes("text-[11px] text-gray-500")
 
     # ------------------------------------------------------------------
@@ -1550,12 +1867,8 @@ class PlotterApp:
 
                 with ui.column().classes("gap-2"):
                     ui.label("Pen Motion").classes("text-[11px] font-medium text-gray-600")
-                    self.cfg_default_pen_pressure = number_field("Default pen pressure", value=-0.1, min_value=-1.0, max_value=1.0, step=0.01)
-                    self.cfg_lift_delta = number_field("Lift delta", value=0.4, min_value=0.0, max_value=1.0, step=0.01)
-                    self.cfg_settle_down = number_field("Settle down (s)", value=0.15, min_value=0.0, max_value=5.0, step=0.01)
-                    self.cfg_settle_up = number_field("Settle up (s)", value=0.15, min_value=0.0, max_value=5.0, step=0.01)
-                    self.cfg_z_step = number_field("Z step", value=0.05, min_value=0.0, max_value=1.0, step=0.01)
-                    self.cfg_z_step_delay = number_field("Z step delay (s)", value=0.00, min_value=0.0, max_value=1.0, step=0.005)
+                    for attr, label, value, lo, hi, step in PEN_MOTION_FIELDS:
+                        setattr(self, attr, number_field(label, value=value, min_value=lo, max_value=hi, step=step))
 
                 with ui.column().classes("gap-2"):
                     ui.label("Optimization").classes("text-[11px] font-medium text-gray-600")
@@ -1695,6 +2008,7 @@ class PlotterApp:
         frac = float(snap.get("fraction", 0.0))
         if self.progress is not None:
             self.progress.set_value(frac)
+            self._schedule_update("summary")
         if self.progress_pct_label is not None:
             self.progress_pct_label.set_text(f"{frac * 100:.0f}%")
         if self.progress_elapsed_label is not None:
@@ -1974,7 +2288,7 @@ class PlotterApp:
             value = float(e.value)
         except (TypeError, ValueError):
             return
-        value = max(0.1, min(5.0, value))
+        value = _clamp(value, 0.1, 5.0)
         if abs(self.pattern_display_width - value) < 1e-6:
             return
         self.pattern_display_width = value
@@ -2027,6 +2341,7 @@ class PlotterApp:
             self.progress_label.set_text("Running...")
         if self.progress is not None:
             self.progress.set_value(0.0)
+            self._schedule_update("summary")
         if self.progress_pct_label is not None:
             self.progress_pct_label.set_text("0%")
         for lbl, txt in (
@@ -2069,6 +2384,7 @@ class PlotterApp:
                 self._append_comms_log("Plot completed.")
                 if self.progress is not None:
                     self.progress.set_value(1.0)
+                    self._schedule_update("summary")
                 if self.progress_pct_label is not None:
                     self.progress_pct_label.set_text("100%")
                 if self.progress_remaining_label is not None:
@@ -2337,6 +2653,7 @@ class PlotterApp:
 
     def _clear_pattern(self) -> None:
         self.pattern = Pattern()
+        self._pattern_revision += 1
         self.pattern_has_data = False
         self.pattern_name = "Empty"
         self.preview_pen_choice = "all"
@@ -2403,6 +2720,7 @@ class PlotterApp:
                     elif isinstance(item, Circle):
                         item.c = (item.c[0] + dx, item.c[1] + dy)
         self.pattern = sanitized
+        self._pattern_revision += 1
         self.pattern_has_data = bool(self.pattern.items)
         self.pattern_name = source_name
         self.preview_pen_choice = "all"
@@ -2512,6 +2830,7 @@ class PlotterApp:
         for item in self.pattern.items:
             if isinstance(item, Polyline):
                 item.pts = [transformer(float(x), float(y)) for x, y in item.pts]
+        self._pattern_revision += 1
         self._update_pattern_summary()
         self._update_canvas()
 
@@ -2845,15 +3164,14 @@ class PlotterApp:
                 except ValueError as exc:
                     raise ValueError(f"Invalid line coordinates in SVG: {exc}") from exc
                 if not should_skip():
-                    p0 = self._apply_transform(current_transform, x1, y1)
-                    p1 = self._apply_transform(current_transform, x2, y2)
-                    pattern.add(Polyline(pts=[p0, p1], pen_id=pen_id))
+                    transformed = self._apply_transform_batch(current_transform, [(x1, y1), (x2, y2)])
+                    pattern.add(Polyline(pts=transformed, pen_id=pen_id))
             elif tag in {"polyline", "polygon"}:
                 points_attr = element.get("points", "")
                 points = self._parse_svg_points(points_attr)
                 if tag == "polygon" and points and points[0] != points[-1]:
                     points.append(points[0])
-                transformed = [self._apply_transform(current_transform, x, y) for x, y in points]
+                transformed = self._apply_transform_batch(current_transform, points)
                 if len(transformed) >= 2 and not should_skip():
                     pattern.add(Polyline(pts=transformed, pen_id=pen_id))
             elif tag == "path":
@@ -2861,7 +3179,7 @@ class PlotterApp:
                 if d_attr:
                     subpaths = self._parse_svg_path(d_attr)
                     for subpath in subpaths:
-                        transformed = [self._apply_transform(current_transform, x, y) for x, y in subpath]
+                        transformed = self._apply_transform_batch(current_transform, subpath)
                         if len(transformed) >= 2 and not self._is_rectangle_path(transformed) and not should_skip():
                             pattern.add(Polyline(pts=transformed, pen_id=pen_id))
             elif tag == "circle":
@@ -2874,7 +3192,7 @@ class PlotterApp:
                 if not should_skip():
                     base_circle = Circle(c=(cx, cy), r=r)
                     poly = base_circle.to_polyline()
-                    transformed = [self._apply_transform(current_transform, x, y) for x, y in poly.pts]
+                    transformed = self._apply_transform_batch(current_transform, poly.pts)
                     pattern.add(Polyline(pts=transformed, pen_id=pen_id))
             elif tag == "ellipse":
                 try:
@@ -2886,12 +3204,11 @@ class PlotterApp:
                     raise ValueError(f"Invalid ellipse in SVG: {exc}") from exc
                 if not should_skip():
                     segments = 64
-                    transformed = []
+                    points = []
                     for k in range(segments + 1):
                         theta = 2 * math.pi * k / segments
-                        x = cx + rx * math.cos(theta)
-                        y = cy + ry * math.sin(theta)
-                        transformed.append(self._apply_transform(current_transform, x, y))
+                        points.append((cx + rx * math.cos(theta), cy + ry * math.sin(theta)))
+                    transformed = self._apply_transform_batch(current_transform, points)
                     pattern.add(Polyline(pts=transformed, pen_id=pen_id))
 
             for child in element:
@@ -2907,7 +3224,9 @@ class PlotterApp:
             raise ValueError("No supported shapes found in SVG.")
         return pattern
 
-    def _svg_tag_name(self, tag: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _svg_tag_name(tag: str) -> str:
         if "}" in tag:
             return tag.split("}", 1)[1]
         return tag
@@ -2930,7 +3249,7 @@ class PlotterApp:
 
     def _tokenize_svg_path(self, d: str) -> List[Any]:
         tokens: List[Any] = []
-        number_re = re.compile(r"[-+]?((\d*\.\d+)|(\d+))(?:[eE][-+]?\d+)?")
+        number_re = _SVG_NUMBER_RE
         i = 0
         length = len(d)
         while i < length:
@@ -2976,10 +3295,6 @@ class PlotterApp:
         if not tokens:
             return []
 
-        command_params = {
-            'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0
-        }
-
         subpaths: List[List[Tuple[float, float]]] = []
         current_path: List[Tuple[float, float]] = []
         cx = cy = 0.0
@@ -3015,7 +3330,7 @@ class PlotterApp:
 
             cmd = current_cmd
             upper = cmd.upper()
-            param_count = command_params.get(upper, None)
+            param_count = _SVG_PATH_PARAM_COUNTS.get(upper, None)
             if param_count is None:
                 cursor += 1
                 continue
@@ -3183,11 +3498,12 @@ class PlotterApp:
                 return False
         return True
 
-    def _identity_transform(self) -> Tuple[float, float, float, float, float, float]:
+    @staticmethod
+    def _identity_transform() -> Tuple[float, float, float, float, float, float]:
         return (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
 
+    @staticmethod
     def _combine_transform(
-        self,
         base: Tuple[float, float, float, float, float, float],
         extra: Tuple[float, float, float, float, float, float],
     ) -> Tuple[float, float, float, float, float, float]:
@@ -3202,22 +3518,36 @@ class PlotterApp:
             b1 * e2 + d1 * f2 + f1,
         )
 
-    def _apply_transform(
+    def _apply_transform_batch(
         self,
         transform: Tuple[float, float, float, float, float, float],
-        x: float,
-        y: float,
-    ) -> Tuple[float, float]:
+        points: List[Tuple[float, float]],
+    ) -> List[Tuple[float, float]]:
+        """Transform a whole shape, picking the cheapest form once per shape.
+
+        Identity and pure translations skip the matrix product; axis-aligned
+        transforms (the Y-flip seeded at the SVG root, optionally scaled and
+        translated) skip the cross terms.
+        """
         a, b, c, d, e, f = transform
-        return (a * x + c * y + e, b * x + d * y + f)
+        if b == 0.0 and c == 0.0:
+            if a == 1.0 and d == 1.0:
+                if e == 0.0 and f == 0.0:
+                    return list(points)
+                return [(x + e, y + f) for x, y in points]
+            return [(a * x + e, d * y + f) for x, y in points]
+        return [(a * x + c * y + e, b * x + d * y + f) for x, y in points]
 
-    def _parse_svg_transform(self, transform_text: str) -> Tuple[float, float, float, float, float, float]:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_svg_transform(transform_text: str) -> Tuple[float, float, float, float, float, float]:
+        # Cached per attribute string: editors repeat the same transform on
+        # many sibling groups, and the parsed matrix is an immutable tuple.
         transform_text = transform_text.strip()
         if not transform_text:
-            return self._identity_transform()
-        pattern_re = re.compile(r"([a-zA-Z]+)\s*\(([^)]*)\)")
-        result = self._identity_transform()
-        for name, args_text in pattern_re.findall(transform_text):
+            return PlotterApp._identity_transform()
+        result = PlotterApp._identity_transform()
+        for name, args_text in _SVG_TRANSFORM_RE.findall(transform_text):
             params = [
                 float(p)
                 for p in re.split(r"[,\s]+", args_text.strip())
@@ -3239,8 +3569,8 @@ class PlotterApp:
                 sin_a = math.sin(rad)
                 if len(params) >= 3:
                     cx, cy = params[1], params[2]
-                    matrix = self._combine_transform(
-                        self._combine_transform(
+                    matrix = PlotterApp._combine_transform(
+                        PlotterApp._combine_transform(
                             (1.0, 0.0, 0.0, 1.0, cx, cy),
                             (cos_a, sin_a, -sin_a, cos_a, 0.0, 0.0),
                         ),
@@ -3257,8 +3587,8 @@ class PlotterApp:
             elif name == "matrix" and len(params) >= 6:
                 matrix = tuple(params[:6])  # type: ignore
             else:
-                matrix = self._identity_transform()
-            result = self._combine_transform(result, matrix)
+                matrix = PlotterApp._identity_transform()
+            result = PlotterApp._combine_transform(result, matrix)
         return result
 
     # ------------------------------------------------------------------
@@ -3268,10 +3598,13 @@ class PlotterApp:
         with ui.card().classes("w-full p-3 gap-2"):
             ui.label("Selection").classes("text-sm font-medium")
             self.selection_label = ui.label("").classes("text-xs")
+            self._last_selection_text = ""
             ui.label("Status").classes("text-sm font-medium")
             self.status_log = ui.log(max_lines=200).classes("text-xs")
-            for line in self.state.status_lines:
-                self.status_log.push(line)
+            # ui.log splits a pushed string on line breaks, so the whole history
+            # goes out in one push instead of one round-trip per line.
+            if self.state.status_lines:
+                self.status_log.push("\n".join(self.state.status_lines))
         self._update_selection_label()
 
     # ------------------------------------------------------------------
@@ -3282,9 +3615,14 @@ class PlotterApp:
 
     def _log_status(self, message: str) -> None:
         self.state.log(message)
-        self._update_status_panels()
+        # A log line never moves the head or the progress bar, so the summary stays as is.
+        self._schedule_update("recent")
 
     def _update_status_panels(self) -> None:
+        self._update_status_summary()
+        self._update_recent_status()
+
+    def _update_status_summary(self) -> None:
         if self.status_summary_label is not None:
             device = self.state.serial_device or "COM3"
             x, y, z = self._current_position()
@@ -3294,24 +3632,31 @@ class PlotterApp:
             summary = (
                 f"Connected | {device} @ 115200 | X={x:.1f} | Y={y:.1f} | Z={z:.2f} | {progress_text}"
             )
-            self.status_summary_label.set_text(summary)
-        if self.recent_status_container is not None:
-            self.recent_status_container.clear()
-            recent = self.state.status_lines[-3:]
-            with self.recent_status_container:
-                for entry in recent:
-                    ui.label(entry).classes("text-xs text-gray-700")
+            # Only push the summary when the formatted text actually changed.
+            if summary != self._last_summary:
+                self.status_summary_label.set_text(summary)
+                self._last_summary = summary
+
+    def _update_recent_status(self) -> None:
+        if self._recent_labels:
+            recent = self.state.recent_status
+            # Reuse the three labels; only their text and visibility change.
+            for index, label in enumerate(self._recent_labels):
+                entry = recent[index] if index < len(recent) else ""
+                label.set_text(entry)
+                label.set_visibility(bool(entry))
 
     def _current_position(self) -> Tuple[float, float, float]:
         entity = self.state.selected_entity
         if entity:
             kind, key = entity
-            if kind == "corner" and key in {"BL", "BR", "TL", "TR"}:
-                x, y = self._corner_world_coords(key)
-                z = self.state.corner_heights.get(str(key), self.state.z_height)
-                return x, y, z
+            if kind == "corner":
+                z = self.state.corner_heights.get(key)
+                if z is not None:
+                    x, y = self._corner_world_coords(key)
+                    return x, y, z
             if kind == "pot":
-                pot = next((p for p in self.state.pots if p.identifier == key), None)
+                pot = self.state.pots_by_id.get(key)
                 if pot:
                     x, y = pot.position
                     return x, y, pot.height
@@ -3324,33 +3669,54 @@ class PlotterApp:
         max_x, max_y = self.state.rect_max
         width = max(0.0, max_x - min_x)
         height = max(0.0, max_y - min_y)
-        self.area_label.text = f"Work area: {width:.1f} × {height:.1f} mm"
+        text = f"Work area: {width:.1f} × {height:.1f} mm"
+        if text != self._last_area_text:
+            self.area_label.text = text
+            self._last_area_text = text
 
     def _update_selection_label(self) -> None:
         if self.selection_label is None:
             return
         entity = self.state.selected_entity
         if not entity:
-            self.selection_label.text = "No selection"
+            self._set_selection_text("No selection")
             return
+        # selected_entity is always stored normalized by _select_entity.
         kind, key = entity
         if kind == "corner":
-            corner_key = str(key)
-            x, y = self._corner_world_coords(corner_key)
-            z = self.state.corner_heights[corner_key]
-            self.selection_label.text = f"Corner {corner_key}: ({x:.1f}, {y:.1f}) | Z {z:.2f}"
+            x, y = self._corner_world_coords(key)
+            z = self.state.corner_heights[key]
+            self._set_selection_text(f"Corner {key}: ({x:.1f}, {y:.1f}) | Z {z:.2f}")
         elif kind == "pot":
-            pot = next((p for p in self.state.pots if p.identifier == int(key)), None)
+            pot = self.state.pots_by_id.get(key)
             if pot is None:
-                self.selection_label.text = "No pot selected"
+                self._set_selection_text("No pot selected")
                 return
             x, y = pot.position
-            self.selection_label.text = (
+            self._set_selection_text(
                 f"Pot #{pot.identifier}: ({x:.1f}, {y:.1f}) | Z {pot.height:.2f} | {pot.color}"
             )
         else:
-            self.selection_label.text = "No selection"
-        self._update_status_panels()
+            self._set_selection_text("No selection")
+        self._schedule_update("summary")
+
+    def _set_selection_text(self, text: str) -> None:
+        if text != self._last_selection_text:
+            self.selection_label.text = text
+            self._last_selection_text = text
+
+    def _set_slider_value(self, value: float) -> None:
+        """Move the Z slider without re-triggering _on_height_change; skips no-op writes."""
+        if self.z_slider is None:
+            return
+        current = self.z_slider.value
+        if current is not None and abs(float(current) - value) <= 1e-6:
+            return
+        try:
+            self._suppress_height_event = True
+            self.z_slider.value = value
+        finally:
+            self._suppress_height_event = False
 
     def _on_height_change(self, e: events.ValueChangeEventArguments) -> None:
         if self._suppress_height_event:
@@ -3361,53 +3727,40 @@ class PlotterApp:
         if entity:
             kind, key = entity
             if kind == "corner":
-                corner_key = str(key)
-                self.state.corner_heights[corner_key] = height
-                self._log_status(f"Set corner {corner_key} height to {height:.2f}.")
+                self.state.corner_heights[key] = height
+                self._log_status(f"Set corner {key} height to {height:.2f}.")
                 self._sync_grbl_compensation()
             elif kind == "pot":
-                pot = next((p for p in self.state.pots if p.identifier == int(key)), None)
+                pot = self.state.pots_by_id.get(key)
                 if pot:
                     pot.height = height
+                    self.state.pots_version += 1
                     self._log_status(f"Set pot #{pot.identifier} height to {height:.2f}.")
                     self._refresh_pots(selected_id=pot.identifier)
-        self._update_selection_label()
-        self._update_canvas()
+        self._schedule_update("selection", "canvas")
         self._schedule_pen_height(height)
 
     def _quick_size(self, size: str) -> None:
-        presets = {
-            "A4": (297.0, 210.0),
-            "A5": (210.0, 148.0),
-            "15 cm": (150.0, 150.0),
-            "10 cm": (100.0, 100.0),
-        }
-        width, height = presets.get(size, (200.0, 200.0))
+        width, height = QUICK_SIZE_PRESETS.get(size, (200.0, 200.0))
         width = min(width, self.state.bed_width)
         height = min(height, self.state.bed_height)
         min_x = max(0.0, (self.state.bed_width - width) / 2)
         min_y = 0.0
         self.state.rect_min = (min_x, min_y)
         self.state.rect_max = (min_x + width, min_y + height)
+        self._pick_dirty = True
         self._sync_grbl_compensation()
-        self._update_canvas()
-        self._update_selection_label()
+        self._schedule_update("canvas", "selection")
         self._log_status(f"Configured work area preset: {size} ({width:.0f} × {height:.0f} mm).")
 
     def _reset_all_z_heights(self) -> None:
-        for key in self.state.corner_heights:
-            self.state.corner_heights[key] = 1.0
+        self.state.corner_heights.update(dict.fromkeys(self.state.corner_heights, 1.0))
         for pot in self.state.pots:
             pot.height = 1.0
+        self.state.pots_version += 1
         self.state.z_height = 1.0
-        if self.z_slider is not None:
-            try:
-                self._suppress_height_event = True
-                self.z_slider.value = 1.0
-            finally:
-                self._suppress_height_event = False
-        self._update_selection_label()
-        self._update_canvas()
+        self._set_slider_value(1.0)
+        self._schedule_update("selection", "canvas")
         self._log_status("Reset all Z heights to 1.0")
 
     def _add_pot(self) -> None:
@@ -3423,6 +3776,9 @@ class PlotterApp:
         )
         self.state.next_pot_id += 1
         self.state.pots.append(pot)
+        self.state.pots_by_id[pot.identifier] = pot
+        self.state.pots_version += 1
+        self._pick_dirty = True
         self.state.selected_pot_id = pot.identifier
         self._refresh_pots(selected_id=pot.identifier)
         self._select_entity(("pot", pot.identifier))
@@ -3433,6 +3789,9 @@ class PlotterApp:
             self._notify("No pots to delete.")
             return
         removed = self.state.pots.pop()
+        self.state.pots_by_id.pop(removed.identifier, None)
+        self.state.pots_version += 1
+        self._pick_dirty = True
         if self.state.selected_pot_id == removed.identifier:
             self.state.selected_pot_id = self.state.pots[-1].identifier if self.state.pots else None
         self._refresh_pots()
@@ -3447,10 +3806,11 @@ class PlotterApp:
             return
         if not self.state.pots or self.state.selected_pot_id is None:
             return
-        pot = next((p for p in self.state.pots if p.identifier == self.state.selected_pot_id), None)
+        pot = self.state.pots_by_id.get(self.state.selected_pot_id)
         if pot is None:
             return
         pot.color = e.value
+        self.state.pots_version += 1
         self._refresh_pots(selected_id=pot.identifier)
         self._log_status(f"Updated pot #{pot.identifier} color to {e.value}.")
 
@@ -3464,7 +3824,7 @@ class PlotterApp:
         except (TypeError, ValueError):
             self._log_status("Invalid pot selection.")
             return
-        pot = next((p for p in self.state.pots if p.identifier == pot_id), None)
+        pot = self.state.pots_by_id.get(pot_id)
         if pot is None:
             self._log_status("Pot selection cleared.")
             return
@@ -3474,11 +3834,15 @@ class PlotterApp:
     def _refresh_pots(self, selected_id: Optional[int] = None) -> None:
         if self.pot_select is None:
             return
-        options = {
-            f"Pot #{p.identifier} (Z {p.height:.2f})": str(p.identifier) for p in self.state.pots
-        }
-        self.pot_select.options = options
-        valid_ids = {p.identifier for p in self.state.pots}
+        # Rebuild the option labels only after a pot was added, removed or edited.
+        version = self.state.pots_version
+        if self._pots_options_cache is None or self._pots_options_cache[0] != version:
+            options = {
+                f"Pot #{p.identifier} (Z {p.height:.2f})": str(p.identifier) for p in self.state.pots
+            }
+            self._pots_options_cache = (version, options)
+            self.pot_select.options = options
+        valid_ids = self.state.pots_by_id
         if selected_id is not None:
             self.state.selected_pot_id = selected_id
         if self.state.selected_pot_id not in valid_ids:
@@ -3492,7 +3856,7 @@ class PlotterApp:
                 self.pot_select.value = target_value
             finally:
                 self._suppress_pot_event = False
-        self._update_canvas()
+        self._schedule_update("canvas")
 
 
 def _parse_bed_size(value: str) -> Tuple[float, float]:
@@ -3,6 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Union, Iterable
 import math, time, threading
+from collections import deque
+
+import numpy as np
 
 XY = Tuple[float, float]
 
@@ -53,10 +56,6 @@ class Circle:
     pen_id: int = 0
     _rev: bool = False
 
-    def _point_at(self, ang_deg: float) -> XY:
-        a = math.radians(ang_deg)
-        return (self.c[0] + self.r * math.cos(a), self.c[1] + self.r * math.sin(a))
-
     def to_polyline(self) -> Polyline:
         # Polygonize once on add. After this, everything is Polyline.
         arc_len = abs(math.radians(self.sweep_deg)) * self.r
@@ -65,11 +64,10 @@ class Circle:
         eang = self.start_deg + self.sweep_deg
         if self._rev:
             s, eang = eang, s
-        pts: List[XY] = []
-        for k in range(n + 1):
-            t = k / n
-            ang = s + (eang - s) * t
-            pts.append(self._point_at(ang))
+        angs = np.radians(s + (eang - s) * (np.arange(n + 1) / n))
+        xs = self.c[0] + self.r * np.cos(angs)
+        ys = self.c[1] + self.r * np.sin(angs)
+        pts: List[XY] = list(zip(xs.tolist(), ys.tolist()))
         return Polyline(pts=pts, pen_pressure=self.pen_pressure, feed_draw=self.feed_draw, pen_id=self.pen_id)
 
 
@@ -115,28 +113,72 @@ class Pattern:
         returns the ordered list together with the position of the last
         endpoint, so callers can chain several runs together.
         """
-        remaining = list(items)
+        n = len(items)
+        if n == 0:
+            return [], start_xy
+        ends = [it.endpoints() for it in items]
+
+        # Uniform grid over candidate start (and end) points, ~1 item per cell.
+        cands = [(p[0], p[1], i, side) for i, se in enumerate(ends)
+                 for side, p in enumerate(se if allow_reverse else se[:1])]
+        min_x = min(c[0] for c in cands); max_x = max(c[0] for c in cands)
+        min_y = min(c[1] for c in cands); max_y = max(c[1] for c in cands)
+        h = max(1e-9, max(max_x - min_x, max_y - min_y) / max(1, int(math.sqrt(n))))
+
+        def cell_of(x: float, y: float) -> Tuple[int, int]:
+            return (math.floor((x - min_x) / h), math.floor((y - min_y) / h))
+
+        grid: dict = {}
+        cells_of: List[list] = [[] for _ in range(n)]
+        for c in cands:
+            key = cell_of(c[0], c[1])
+            grid.setdefault(key, []).append(c)
+            cells_of[c[2]].append((key, c))
+        gx0, gy0 = cell_of(min_x, min_y)
+        gx1, gy1 = cell_of(max_x, max_y)
+
+        def ring(cx: int, cy: int, r: int):
+            if r == 0:
+                yield (cx, cy)
+                return
+            xa, xb = max(cx - r, gx0), min(cx + r, gx1)
+            for gy in (cy - r, cy + r):
+                if gy0 <= gy <= gy1:
+                    for gx in range(xa, xb + 1):
+                        yield (gx, gy)
+            ya, yb = max(cy - r + 1, gy0), min(cy + r - 1, gy1)
+            for gx in (cx - r, cx + r):
+                if gx0 <= gx <= gx1:
+                    for gy in range(ya, yb + 1):
+                        yield (gx, gy)
+
         ordered: List[Item] = []
         cur = start_xy
-
-        def dist(a: XY, b: XY) -> float:
-            return math.hypot(a[0]-b[0], a[1]-b[1])
-
-        while remaining:
-            best_i, best_cost, best_cfg = None, float("inf"), False
-            for i, it in enumerate(remaining):
-                s0, e0 = it.endpoints()
-                d_fwd = dist(cur, s0)
-                if allow_reverse:
-                    d_rev = dist(cur, e0)
-                    cost, cfg = (d_fwd, False) if d_fwd <= d_rev else (d_rev, True)
-                else:
-                    cost, cfg = d_fwd, it._rev
-                if cost < best_cost:
-                    best_i, best_cost, best_cfg = i, cost, cfg
-            it = remaining.pop(best_i)  # type: ignore
+        for _ in range(n):
+            cx, cy = cell_of(cur[0], cur[1])
+            r = max(0, gx0 - cx, cx - gx1, gy0 - cy, cy - gy1)
+            r_max = max(cx - gx0, gx1 - cx, cy - gy0, gy1 - cy)
+            # best key: (squared distance, item index, side) - same tie-breaks as a linear scan
+            best = None
+            while r <= r_max:
+                if best is not None and r > 2 and ((r - 2) * h) ** 2 > best[0]:
+                    break
+                for key in ring(cx, cy, r):
+                    for x, y, i, side in grid.get(key, ()):
+                        dx, dy = cur[0] - x, cur[1] - y
+                        cand = (dx*dx + dy*dy, i, side)
+                        if best is None or cand < best:
+                            best = cand
+                r += 1
+            _, best_i, side = best  # type: ignore
+            it = items[best_i]
+            for key, c in cells_of[best_i]:
+                bucket = grid[key]
+                bucket.remove(c)
+                if not bucket:
+                    del grid[key]
             if allow_reverse:
-                it._rev = bool(best_cfg)
+                it._rev = bool(side)
             _, e = it.endpoints()
             cur = e
             ordered.append(it)
@@ -273,7 +315,8 @@ class Pattern:
 
         for it in self.items:
             if isinstance(it, Polyline):
-                pts = list(reversed(it.pts)) if it._rev else list(it.pts)
+                # read-only: merging copies into a fresh chain list
+                pts = it.pts[::-1] if it._rev else it.pts
                 if pts:
                     chains.append((pts, it.pen_pressure, it.feed_draw, it.pen_id))
 
@@ -281,47 +324,67 @@ class Pattern:
         merged: List[Tuple[List[XY], float, Optional[int], int]] = []
         merges_done = 0
 
+        tol2 = join_tol_mm * join_tol_mm
+
         def almost(a: XY, b: XY) -> bool:
-            return math.hypot(a[0]-b[0], a[1]-b[1]) <= join_tol_mm
+            dx, dy = a[0] - b[0], a[1] - b[1]
+            return dx*dx + dy*dy <= tol2
+
+        # Grid buckets of chain endpoints per pen; a match lies in the 3x3 cells around a point.
+        cell = max(join_tol_mm, 1e-9)
+        buckets: dict = {}
+        for j, (pts_j, _, _, pen_j) in enumerate(chains):
+            for p in (pts_j[0], pts_j[-1]):
+                buckets.setdefault((pen_j, math.floor(p[0] / cell), math.floor(p[1] / cell)), []).append(j)
+
+        def near(p: XY, pen: int) -> set:
+            cx, cy = math.floor(p[0] / cell), math.floor(p[1] / cell)
+            found = set()
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    found.update(buckets.get((pen, gx, gy), ()))
+            return found
 
         for i in range(len(chains)):
             if used[i]:
                 continue
             pts_i, press_i, fd_i, pen_i = chains[i]
-            if not pts_i:
-                used[i] = True
-                continue
-
-            chain = pts_i[:]
+            # deque: grows at either end without copying the points merged so far
+            chain = deque(pts_i)
             used[i] = True
 
-            changed = True
-            while changed:
-                changed = False
-                for j in range(len(chains)):
-                    if used[j] or j == i:
-                        continue
-                    pts_j, press_j, fd_j, pen_j = chains[j]
-                    if not pts_j or pen_j != pen_i:
-                        continue
-
+            # Passes over candidates in index order, repeated while a pass merged something.
+            last_j = -1
+            changed = False
+            while True:
+                candidates = sorted(j for j in near(chain[-1], pen_i) | near(chain[0], pen_i)
+                                    if j > last_j and not used[j])
+                for j in candidates:
+                    pts_j = chains[j][0]
                     # four endpoint match cases
                     if almost(chain[-1], pts_j[0]):
-                        chain = chain + pts_j[1:]
+                        chain.extend(pts_j[1:])
                     elif almost(chain[-1], pts_j[-1]):
-                        chain = chain + list(reversed(pts_j[:-1]))
+                        chain.extend(reversed(pts_j[:-1]))
                     elif almost(chain[0], pts_j[-1]):
-                        chain = pts_j[:-1] + chain
+                        chain.extendleft(reversed(pts_j[:-1]))
                     elif almost(chain[0], pts_j[0]):
-                        chain = list(reversed(pts_j[1:])) + chain
+                        chain.extendleft(pts_j[1:])
                     else:
                         continue
+                    break
+                else:
+                    if not changed:
+                        break
+                    last_j, changed = -1, False
+                    continue
 
-                    used[j] = True
-                    merges_done += 1
-                    changed = True
+                used[j] = True
+                merges_done += 1
+                changed = True
+                last_j = j
 
-            merged.append((chain, press_i, fd_i, pen_i))
+            merged.append((list(chain), press_i, fd_i, pen_i))
 
         lifts_before = max(0, len(self.items) - 1)
         self.items = [Polyline(pts=m[0], pen_pressure=m[1], feed_draw=m[2], pen_id=m[3]) for m in merged]
@@ -331,34 +394,42 @@ class Pattern:
 
 # ----------------------------- Geometry utils -----------------------------
 
-def _rdp(pts: List[XY], eps: float) -> List[XY]:
-    if len(pts) <= 2:
-        return pts[:]
-    stack = [(0, len(pts) - 1)]
-    keep = [False] * len(pts)
+def _rdp_mask_np(arr: np.ndarray, eps2: float) -> np.ndarray:
+    stack = [(0, len(arr) - 1)]
+    keep = np.zeros(len(arr), dtype=bool)
     keep[0] = keep[-1] = True
     while stack:
         i0, i1 = stack.pop()
-        a, b = pts[i0], pts[i1]
-        max_d = -1.0; idx = None
-        for i in range(i0 + 1, i1):
-            # perpendicular distance from pts[i] to segment ab
-            ax, ay = a; bx, by = b; px, py = pts[i]
-            dx, dy = bx - ax, by - ay
-            if dx == 0 and dy == 0:
-                d = math.hypot(px - ax, py - ay)
-            else:
-                t = ((px - ax) * dx + (py - ay) * dy) / (dx*dx + dy*dy)
-                t = max(0.0, min(1.0, t))
-                cx, cy = ax + t*dx, ay + t*dy
-                d = math.hypot(px - cx, py - cy)
-            if d > max_d:
-                max_d, idx = d, i
-        if max_d > eps and idx is not None:
+        if i1 - i0 < 2:
+            continue
+        a = arr[i0]
+        ab = arr[i1] - a
+        seg = arr[i0 + 1:i1] - a
+        # squared perpendicular distance from each point to segment ab;
+        # a degenerate ab gets inv = 0, i.e. t = 0 and plain distance to a
+        ab2 = float(ab @ ab)
+        inv = 1.0 / ab2 if ab2 > 0.0 else 0.0
+        t = np.clip((seg @ ab) * inv, 0.0, 1.0)
+        off = seg - t[:, None] * ab
+        d2 = (off * off).sum(axis=1)
+        k = int(d2.argmax())
+        if d2[k] > eps2:
+            idx = i0 + 1 + k
             keep[idx] = True
             stack.append((i0, idx))
             stack.append((idx, i1))
-    return [p for p, k in zip(pts, keep) if k]
+    return keep
+
+try:
+    from pattern_numba import rdp_mask as _rdp_mask
+except ImportError:
+    _rdp_mask = _rdp_mask_np
+
+def _rdp(pts: List[XY], eps: float) -> List[XY]:
+    if len(pts) <= 2:
+        return pts[:]
+    keep = _rdp_mask(np.ascontiguousarray(pts, dtype=np.float64), eps * eps)
+    return [pts[i] for i in np.flatnonzero(keep).tolist()]
 
 def _split_long(pts: List[XY], max_seg: float) -> List[XY]:
     if not pts:
@@ -404,7 +475,7 @@ def estimate_run_time(items: Iterable["Polyline"], start_xy: XY, *,
     for it in items:
         if not isinstance(it, Polyline):
             continue
-        pts = list(reversed(it.pts)) if it._rev else list(it.pts)
+        pts = it.pts[::-1] if it._rev else it.pts
         if len(pts) < 2:
             continue
         strokes += 1
@@ -442,6 +513,15 @@ DEFAULT_PEN_COLORS = {
 }
 
 
+def _pen_filter(pens: Optional[Union[int, Iterable[int]]]) -> Tuple[Optional[int], Optional[frozenset]]:
+    """Normalize a pen filter to (single pen, pen set); (None, None) means all pens."""
+    if pens is None:
+        return None, None
+    if isinstance(pens, int):
+        return pens, None
+    return None, frozenset(pens)
+
+
 class RendererCancelled(Exception):
     """Raised when a renderer run is cancelled."""
 
@@ -567,6 +647,7 @@ class Renderer:
         feed-hold for a pause, and it raises promptly when a cancel is
         requested instead of timing out.
         """
+        poll_idle = getattr(self.g, 'poll_idle', None)
         t0 = time.time()
         while True:
             self._check_cancelled()
@@ -574,14 +655,28 @@ class Renderer:
                 self._wait_if_paused()   # block here while paused
                 t0 = time.time()         # don't count paused time toward timeout
                 self._check_cancelled()
-            try:
-                if self.g.is_idle():
+            if poll_idle is not None:
+                # waits on the port, so an IDLE report ends the wait as soon as it arrives
+                t_next = time.time() + 0.05
+                try:
+                    idle = poll_idle(0.05)
+                except OSError:
+                    # transient port trouble (serial.SerialException is an OSError): retry until timeout
+                    idle = None
+                if idle:
                     return
-            except Exception:
-                pass
+                rest = t_next - time.time()
+                if rest > 0:
+                    time.sleep(rest)
+            else:
+                try:
+                    if self.g.is_idle():
+                        return
+                except Exception:
+                    pass
+                time.sleep(0.05)
             if time.time() - t0 > timeout:
                 raise TimeoutError("GRBL did not become IDLE in time.")
-            time.sleep(0.05)
 
     def _abort_and_park(self) -> None:
         """Cleanly stop a cancelled job: halt motion, flush GRBL's buffer,
@@ -700,14 +795,15 @@ class Renderer:
                   "or attach via r.attach_widget_api(ppw._PPW_API).")
             return
 
-        pens_set = None
-        if pens is not None:
-            pens_set = set([pens] if isinstance(pens, int) else list(pens))
+        pen_one, pens_set = _pen_filter(pens)
 
         strokes = []
         for it in pattern.items:
             if isinstance(it, Polyline):
-                if pens_set is not None and it.pen_id not in pens_set:
+                if pen_one is not None:
+                    if it.pen_id != pen_one:
+                        continue
+                elif pens_set is not None and it.pen_id not in pens_set:
                     continue
                 pts = list(reversed(it.pts)) if it._rev else list(it.pts)
                 if len(pts) < 2:
@@ -733,10 +829,12 @@ class Renderer:
             combine: Optional[dict] = None,    # {'join_tol_mm':...}
             return_home: bool = True,
             pen_filter: Optional[Union[int, Iterable[int]]] = None,
-            preview_in_widget: bool = False) -> None:
+            preview_in_widget: bool = False,
+            verbose: bool = True) -> None:
         """
         pen_filter: None (all pens) or an int / iterable of ints to restrict draw.
         preview_in_widget: if True, send a preview to the widget before executing.
+        verbose: if False, skip the before/after travel estimate around ordering.
         """
 
         self.reset_control()
@@ -755,18 +853,21 @@ class Renderer:
         allow_reverse = (hatch_orient == 'optimize')
 
         if optimize in ('nn', 'tiled'):
-            before = self._travel_estimate(pattern, start_xy)
+            before = self._travel_estimate(pattern, start_xy) if verbose else 0.0
             if optimize == 'tiled':
                 pattern.optimize_order_tiled(int(tile_grid), start_xy=start_xy,
                                              allow_reverse=allow_reverse)
             else:
                 pattern.optimize_order_nn(start_xy=start_xy, allow_reverse=allow_reverse)
-            after = self._travel_estimate(pattern, start_xy)
-            gain = max(0.0, before - after)
-            pct = (gain / before * 100.0) if before > 0 else 0.0
             label = f"tiled({tile_grid}x{tile_grid})" if optimize == 'tiled' else 'nn'
-            print(f"Optimize order: {label}, travel {before:.2f} -> {after:.2f} mm, "
-                  f"saved {gain:.2f} mm ({pct:.1f} percent).")
+            if verbose:
+                after = self._travel_estimate(pattern, start_xy)
+                gain = max(0.0, before - after)
+                pct = (gain / before * 100.0) if before > 0 else 0.0
+                print(f"Optimize order: {label}, travel {before:.2f} -> {after:.2f} mm, "
+                      f"saved {gain:.2f} mm ({pct:.1f} percent).")
+            else:
+                print(f"Optimize order: {label}, {len(pattern.items)} items.")
 
         if hatch_orient in ('directional', 'keep'):
             print(pattern.apply_hatch_orientation(hatch_orient))
@@ -774,14 +875,15 @@ class Renderer:
         if preview_in_widget:
             self.plot(pattern, pens=pen_filter)
 
-        pens_set = None
-        if pen_filter is not None:
-            pens_set = set([pen_filter] if isinstance(pen_filter, int) else list(pen_filter))
+        pen_one, pens_set = _pen_filter(pen_filter)
 
         exec_items: List[Polyline] = []
         for it in pattern.items:
             if isinstance(it, Polyline):
-                if pens_set is None or it.pen_id in pens_set:
+                if pen_one is not None:
+                    if it.pen_id == pen_one:
+                        exec_items.append(it)
+                elif pens_set is None or it.pen_id in pens_set:
                     exec_items.append(it)
             else:
                 raise TypeError(f"Unsupported item at execution: {type(it).__name__}")
@@ -823,7 +925,8 @@ class Renderer:
     def _run_polyline(self, it: Polyline):
         if len(it.pts) < 2:
             return
-        pts = list(reversed(it.pts)) if it._rev else list(it.pts)
+        # read-only below: only reversed strokes need a copy
+        pts = it.pts[::-1] if it._rev else it.pts
 
         # travel to start at feed_travel
         x0, y0 = pts[0]
@@ -858,7 +961,7 @@ class Renderer:
                 self._check_cancelled()
                 self._wait_if_paused()
                 sx, sy = pts[i - 1]; ex, ey = pts[i]
-                self.g.draw_xy(ex, ey, wait=False)
+                self._draw_to(ex, ey)
                 self._advance_progress(math.hypot(ex - sx, ey - sy))
                 if i % self.flush_every == 0:
                     self._wait_idle()
@@ -876,7 +979,7 @@ class Renderer:
                 self._check_cancelled()
                 self._wait_if_paused()
                 self._pen_set(z, settle=False)
-                self.g.draw_xy(ex, ey, wait=False)
+                self._draw_to(ex, ey)
                 self._advance_progress(math.hypot(ex - sx, ey - sy))
                 if i % self.flush_every == 0:
                     self._wait_idle()
@@ -896,7 +999,7 @@ class Renderer:
                 if abs(z - cur_z) > self.z_threshold:
                     self._pen_set(z, settle=False)
                     cur_z = z
-                self.g.draw_xy(ex, ey, wait=False)
+                self._draw_to(ex, ey)
                 self._advance_progress(math.hypot(ex - sx, ey - sy))
                 if i % self.flush_every == 0:
                     self._wait_idle()
@@ -909,6 +1012,26 @@ class Renderer:
 
     # ------------------------- internal helpers --------------------------
 
+    def _draw_to(self, x: float, y: float) -> None:
+        stream = getattr(self.g, 'stream_xy', None)
+        if stream is None:
+            self.g.draw_xy(x, y, wait=False)
+            return
+        t0 = time.time()
+        while True:
+            try:
+                stream(x, y)
+                return
+            except TimeoutError:
+                # GRBL's buffer stayed full: a long move, a feed hold or a cancel
+                self._check_cancelled()
+                if not self._pause_event.is_set():
+                    self._wait_if_paused()
+                    t0 = time.time()  # don't count paused time, as in _wait_idle
+                    self._check_cancelled()
+                elif time.time() - t0 > 120.0:
+                    raise TimeoutError("GRBL stopped acknowledging streamed moves.")
+
     def _pen_pos(self, x: float, y: float, pen_pressure: float) -> float:
         # grbl.compensated_pos expects 'pos_offset'; map our pen_pressure to it.
         if pen_pressure is None:
@@ -0,0 +1,55 @@
+# pattern_numba.py
+# Optional Numba kernels for pattern.py. Importing this module raises
+# ImportError when numba is not installed; pattern.py then falls back to NumPy.
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def rdp_mask(pts, eps2):
+    """Ramer-Douglas-Peucker keep mask for a contiguous (N, 2) float64 array.
+
+    ``eps2`` is the squared tolerance, so no square roots are taken.
+    """
+    n = pts.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    if n == 0:
+        return keep
+    keep[0] = True
+    keep[n - 1] = True
+    lo = np.empty(n, dtype=np.int64)
+    hi = np.empty(n, dtype=np.int64)
+    lo[0] = 0
+    hi[0] = n - 1
+    top = 1
+    while top > 0:
+        top -= 1
+        i0 = lo[top]
+        i1 = hi[top]
+        ax = pts[i0, 0]
+        ay = pts[i0, 1]
+        dx = pts[i1, 0] - ax
+        dy = pts[i1, 1] - ay
+        ab2 = dx * dx + dy * dy
+        # degenerate segment: inv = 0 gives t = 0, the distance to the start point
+        inv = 1.0 / ab2 if ab2 > 0.0 else 0.0
+        max_d2 = -1.0
+        idx = -1
+        for i in range(i0 + 1, i1):
+            px = pts[i, 0] - ax
+            py = pts[i, 1] - ay
+            t = min(1.0, max(0.0, (px * dx + py * dy) * inv))
+            ox = px - t * dx
+            oy = py - t * dy
+            d2 = ox * ox + oy * oy
+            if d2 > max_d2:
+                max_d2 = d2
+                idx = i
+        if idx >= 0 and max_d2 > eps2:
+            keep[idx] = True
+            lo[top] = i0
+            hi[top] = idx
+            lo[top + 1] = idx
+            hi[top + 1] = i1
+            top += 2
+    return keep
@@ -3,18 +3,42 @@
 
 from __future__ import annotations
 
+import io
 import time
 import re
 import math
-from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict
+import select
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Iterable, List, Tuple, Optional, Dict, Union
+
+import numpy as np
 
 # ----------------------------- GRBL status parsing -----------------------------
 
-_STATUS_STATE = re.compile(r'^<\s*([A-Za-z]+)(?=[|,>])')
-_STATUS_WPOS  = re.compile(r'WPos:([^|>]+)')
-_STATUS_MPOS  = re.compile(r'MPos:([^|>]+)')
-_STATUS_WCO   = re.compile(r'WCO:([^|>]+)')
+# One pass over a status report: the leading state plus WPos/MPos/WCO fields.
+# Values stop at letters so GRBL 0.9's comma-separated fields don't swallow each other.
+_STATUS_FIELDS = re.compile(
+    r'^<\s*(?P<state>[A-Za-z]+)(?=[|,>])'
+    r'|WPos:(?P<wpos>[^|>A-Za-z]+)'
+    r'|MPos:(?P<mpos>[^|>A-Za-z]+)'
+    r'|WCO:(?P<wco>[^|>A-Za-z]+)'
+)
+
+
+# GRBL answers '?' within milliseconds; a query pending longer than this was dropped.
+_STATUS_STALE_S = 0.25
+
+
+def _parse_xyz(text: str) -> Tuple[float, ...]:
+    return tuple(float(v) for v in text.split(',', 3)[:3])
+
+
+def _clamp(value: float, lo: float, hi: float) -> float:
+    # max(lo, min(hi, value)) without the calls; lo still wins if lo > hi
+    if value > hi:
+        value = hi
+    return lo if value < lo else value
 
 try:
     import serial
@@ -24,12 +48,13 @@ except ImportError as e:
 
 # ---------------------------------- Data ----------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     # Serial
     port: str = '/dev/tty.usbserial-A50285BI'
     baudrate: int = 115200
     read_timeout_s: float = 1.0
+    rx_buffer_size: int = 127  # GRBL serial RX buffer (128) minus one, for streamed moves
 
     # Workspace (mm)
     x_max: float = 300.0
@@ -48,7 +73,7 @@ class Config:
     clip_to_bed: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Rect:
     x0: float
     y0: float
@@ -64,7 +89,7 @@ class Rect:
     def cy(self) -> float: return 0.5 * (self.y0 + self.y1)
 
 
-@dataclass
+@dataclass(slots=True)
 class Compensation:
     """
     Bilinear pen-height compensation across a rectangular area.
@@ -77,14 +102,17 @@ class Compensation:
     hTR: float   # (x1,y1)
 
     def height_at(self, x: float, y: float) -> float:
-        x = min(max(x, self.area.x0), self.area.x1)
-        y = min(max(y, self.area.y0), self.area.y1)
-        dx = self.area.x1 - self.area.x0
-        dy = self.area.y1 - self.area.y0
+        if self.hBL == self.hBR == self.hTL == self.hTR:
+            return self.hBL  # flat (uncalibrated) bed: no blend needed
+        a = self.area
+        x = _clamp(x, a.x0, a.x1)
+        y = _clamp(y, a.y0, a.y1)
+        dx = a.x1 - a.x0
+        dy = a.y1 - a.y0
         if dx <= 0 or dy <= 0:
             return self.hBL
-        u = (x - self.area.x0) / dx
-        v = (y - self.area.y0) / dy
+        u = (x - a.x0) / dx
+        v = (y - a.y0) / dy
         return ((1-u)*(1-v)*self.hBL +
                 u*(1-v)*self.hBR +
                 (1-u)*v*self.hTL +
@@ -104,6 +132,59 @@ class Compensation:
         )
 
 
+@dataclass(slots=True, eq=False)  # identity equality: heights is an ndarray
+class GridCompensation:
+    """
+    Bilinear pen-height compensation over a regular grid of measured heights.
+    heights[j, i] is the pen 'pos' at x = x0 + i*(x1-x0)/(nx-1), y = y0 + j*(y1-y0)/(ny-1).
+    """
+    area: Rect
+    heights: np.ndarray  # shape (ny, nx), ny and nx >= 2
+    _rows: List[List[float]] = field(init=False, repr=False)  # heights as floats, for height_at
+
+    def __post_init__(self):
+        self.heights = np.ascontiguousarray(self.heights, dtype=np.float32)
+        if self.heights.ndim != 2 or min(self.heights.shape) < 2:
+            raise ValueError(f"heights must be a 2-D grid of at least 2x2, got shape {self.heights.shape}")
+        a = self.area
+        if a.x1 <= a.x0 or a.y1 <= a.y0:
+            raise ValueError("GridCompensation area must have positive width and height")
+        self._rows = self.heights.tolist()
+
+    def height_at_batch(self, xs, ys) -> np.ndarray:
+        a = self.area
+        H = self.heights
+        ny, nx = H.shape
+        gx = (np.clip(np.asarray(xs, dtype=float), a.x0, a.x1) - a.x0) * ((nx - 1) / (a.x1 - a.x0))
+        gy = (np.clip(np.asarray(ys, dtype=float), a.y0, a.y1) - a.y0) * ((ny - 1) / (a.y1 - a.y0))
+        ix = np.minimum(gx.astype(np.intp), nx - 2)  # gx >= 0, so truncation is floor
+        iy = np.minimum(gy.astype(np.intp), ny - 2)
+        u = gx - ix
+        v = gy - iy
+        return ((1-u)*(1-v)*H[iy, ix] +
+                u*(1-v)*H[iy, ix + 1] +
+                (1-u)*v*H[iy + 1, ix] +
+                u*v*H[iy + 1, ix + 1])
+
+    def height_at(self, x: float, y: float) -> float:
+        # scalar twin of height_at_batch, called per vertex from compensated_pos
+        a = self.area
+        H = self._rows
+        ny, nx = len(H), len(H[0])
+        gx = (_clamp(x, a.x0, a.x1) - a.x0) * ((nx - 1) / (a.x1 - a.x0))
+        gy = (_clamp(y, a.y0, a.y1) - a.y0) * ((ny - 1) / (a.y1 - a.y0))
+        ix = min(int(gx), nx - 2)
+        iy = min(int(gy), ny - 2)
+        u = gx - ix
+        v = gy - iy
+        r0 = H[iy]
+        r1 = H[iy + 1]
+        return ((1-u)*(1-v)*r0[ix] +
+                u*(1-v)*r0[ix + 1] +
+                (1-u)*v*r1[ix] +
+                u*v*r1[ix + 1])
+
+
 # --------------------------------- GRBL Core ------------------------------------
 
 class GRBL:
@@ -120,12 +201,20 @@ class GRBL:
         self.ser: Optional[serial.Serial] = None
         self._pen_pos: float = 1.0  # track last commanded position [0..1], default up
         self._last_servo: Optional[int] = None  # last servo value actually sent
-        self._comp: Optional[Compensation] = None
+        self._comp: Optional[Union[Compensation, GridCompensation]] = None
+        self._comp_k: Optional[Tuple[float, ...]] = None  # unpacked bilinear terms, see set_compensation
+        self._stream: Deque[int] = deque()  # byte lengths of streamed lines awaiting 'ok'
+        self._stream_bytes: int = 0
+        self._rx = bytearray()  # received bytes not yet split into lines
+        self._status_pending: bool = False  # a '?' was sent and its report not read yet
+        self._status_sent: float = 0.0  # time.time() of the last '?'
+        self._report_mask: Optional[int] = None  # $10 value set by ensure_wpos on this connection
 
     # -------- Connection / basic I/O --------
     def connect(self) -> "GRBL":
         self.ser = serial.Serial(self.cfg.port, baudrate=self.cfg.baudrate, timeout=self.cfg.read_timeout_s)
         time.sleep(2.0)
+        self._report_mask = None
         self._writeln('\r\n')  # wake
         self.flush_input()
         self.cmd('G90')
@@ -142,10 +231,53 @@ class GRBL:
         self.ser.write(s.encode())
         self.ser.flush()
 
+    def _write_many(self, *lines: bytes):
+        """Send several short commands with a single write/flush."""
+        self.ser.write(b'\n'.join(lines) + b'\n')
+        self.ser.flush()
+
+    def _readline_raw(self) -> bytes:
+        """Next reply line as bytes without its line ending, or b'' if none arrives within read_timeout_s.
+
+        Reads whatever is waiting in one call instead of pyserial's
+        byte-at-a-time readline(), and keeps partial lines for the next call.
+        """
+        rx = self._rx
+        while True:
+            i = rx.find(b'\n')
+            if i >= 0:
+                # GRBL ends lines with '\r\n' and sends no other padding, so only the '\r' is trimmed
+                line = bytes(rx[:i - 1 if i and rx[i - 1] == 13 else i])
+                del rx[:i + 1]
+                if line[:1] == b'<':
+                    # whoever reads the report (cmd, a stream drain, status_poll) answers the '?'
+                    self._status_pending = False
+                return line
+            chunk = self.ser.read(max(1, self.ser.in_waiting))
+            if not chunk:
+                return b''
+            rx += chunk
+
+    def _wait_readable(self, timeout: float) -> bool:
+        """Wait up to timeout s for serial input; True as soon as bytes are waiting."""
+        if b'\n' in self._rx or self.ser.in_waiting:
+            return True
+        if timeout <= 0:
+            return False
+        try:
+            select.select([self.ser.fileno()], [], [], timeout)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            # e.g. Windows COM ports: fileno() is unsupported and select() only takes sockets
+            time.sleep(timeout)
+        return self.ser.in_waiting > 0
+
+    def _readline(self) -> str:
+        return self._readline_raw().decode(errors='ignore')
+
     def _readlines_until_timeout(self) -> List[str]:
         lines, t0 = [], time.time()
         while True:
-            line = self.ser.readline().decode(errors='ignore').strip()
+            line = self._readline()
             if line:
                 lines.append(line)
                 if line.lower().startswith('ok'):
@@ -155,60 +287,174 @@ class GRBL:
         return lines
 
     def cmd(self, gcode: str, wait_ok: bool = True) -> List[str]:
+        if gcode.startswith('$'):
+            self._report_mask = None  # any settings command may have changed $10
+        self._drain_stream()
         self._writeln(gcode)
         return self._readlines_until_timeout() if wait_ok else []
 
     def flush_input(self):
         if self.ser:
             self.ser.reset_input_buffer()
+        # discarded input includes partial lines and pending acks for streamed lines
+        self._rx.clear()
+        self._stream.clear()
+        self._status_pending = False
+        self._stream_bytes = 0
+
+    # -------- Streaming (character counting) --------
+    def _note_ack(self, line: bytes) -> None:
+        # acks are only compared as bytes; nothing on the streaming path is decoded
+        if self._stream and line.startswith((b'ok', b'error')):
+            self._stream_bytes -= self._stream.popleft()
+
+    def _drain_stream(self, timeout: Optional[float] = None):
+        """Collect acks for all streamed lines, so the next reply belongs to the next command.
+
+        Gives up after read_timeout_s without a reply, or after ``timeout`` s in
+        total when given (for lines GRBL acks late, such as dwells).
+        """
+        t0 = time.time()
+        while self._stream:
+            line = self._readline_raw()
+            if not line:
+                if timeout is not None and time.time() - t0 < timeout:
+                    continue
+                # no reply in time: stop tracking, like cmd() moving on
+                self._stream.clear()
+                self._stream_bytes = 0
+                return
+            self._note_ack(line)
+
+    def _stream_line(self, data: bytes, timeout: float):
+        t0 = time.time()
+        while self._stream and self._stream_bytes + len(data) > self.cfg.rx_buffer_size:
+            line = self._readline_raw()
+            if line:
+                self._note_ack(line)
+            elif time.time() - t0 >= timeout:
+                raise TimeoutError("GRBL did not acknowledge streamed moves in time.")
+        self.ser.write(data)
+        self._stream.append(len(data))
+        self._stream_bytes += len(data)
+
+    def stream_xy(self, x: float, y: float):
+        """Queue a G1 draw move without waiting for its 'ok'.
+
+        Lines are written back to back while at most ``cfg.rx_buffer_size``
+        bytes are unacknowledged, so GRBL's planner stays full instead of
+        paying a serial round trip per point. Raises TimeoutError (nothing
+        written) if GRBL frees no buffer space within ``cfg.read_timeout_s``;
+        the caller may simply retry.
+        """
+        data = f'G1 X{self._clip_x(x):.3f} Y{self._clip_y(y):.3f} F{self.cfg.feed_draw}\n'.encode()
+        self._stream_line(data, self.cfg.read_timeout_s)
+
+    def stream(self, lines: Iterable[str], timeout: float = 30.0):
+        """Stream G-code lines like ``stream_xy``, waiting up to ``timeout`` s per line for buffer space."""
+        for line in lines:
+            if not line.endswith('\n'):
+                line += '\n'
+            self._stream_line(line.encode(), timeout)
 
     # -------- Status / idle waiting --------
     def ensure_wpos(self):
-        self.cmd("$10=3")  # bit0=MPos, bit1=WPos
-        for _ in range(3):
-            _ = self.status()
-            time.sleep(0.05)
+        if self._report_mask != 3:
+            self.cmd("$10=3")  # bit0=MPos, bit1=WPos
+            self._report_mask = 3
+        self.status()  # the first report after the 'ok' already uses the new mask
 
     def status(self) -> dict:
+        # reuse an outstanding '?' unless it is old enough to have been lost
+        if not self._status_pending or time.time() - self._status_sent >= _STATUS_STALE_S:
+            self.ser.write(b'?')
+            self.ser.flush()
+        self._status_pending = False
+        line = self._readline_raw()
+        # acks for streamed lines may arrive ahead of the status report
+        while self._stream and line and not line.startswith(b'<'):
+            self._note_ack(line)
+            line = self._readline_raw()
+        return self._parse_status(line.decode(errors='ignore'))
+
+    def status_request(self):
+        """Send a '?' query without waiting; pick the report up with status_poll()."""
         self.ser.write(b'?')
         self.ser.flush()
-        line = self.ser.readline().decode(errors='ignore').strip()
+        self._status_pending = True
+        self._status_sent = time.time()
+
+    def status_poll(self) -> Optional[dict]:
+        """Parsed report for the pending status_request(), or None if it has not arrived yet."""
+        waiting = self.ser.in_waiting
+        if waiting:
+            self._rx += self.ser.read(waiting)
+        while b'\n' in self._rx:
+            line = self._readline_raw()  # a complete line is buffered, so this doesn't block
+            if line.startswith(b'<'):
+                return self._parse_status(line.decode(errors='ignore'))
+            self._note_ack(line)
+        return None
 
-        state = None
-        wpos = None
-        m = _STATUS_STATE.search(line)
-        if m:
-            state = m.group(1)
+    @staticmethod
+    def _parse_status(line: str) -> dict:
+        fields: Dict[str, str] = {}
+        for m in _STATUS_FIELDS.finditer(line):
+            fields.setdefault(m.lastgroup, m.group(m.lastgroup))
 
-        m_w = _STATUS_WPOS.search(line)
-        if m_w:
-            wpos = tuple(float(v) for v in m_w.group(1).split(',')[:3])
-        else:
-            m_m = _STATUS_MPOS.search(line)
-            if m_m:
-                mpos = [float(v) for v in m_m.group(1).split(',')[:3]]
-                m_c  = _STATUS_WCO.search(line)
-                if m_c:
-                    wco  = [float(v) for v in m_c.group(1).split(',')[:3]]
-                    wpos = tuple(mp - wc for mp, wc in zip(mpos, wco))
-                else:
-                    wpos = tuple(mpos)
+        state = fields.get('state')
+        wpos = None
+        if 'wpos' in fields:
+            wpos = _parse_xyz(fields['wpos'])
+        elif 'mpos' in fields:
+            mpos = _parse_xyz(fields['mpos'])
+            if 'wco' in fields:
+                wco  = _parse_xyz(fields['wco'])
+                wpos = tuple(mp - wc for mp, wc in zip(mpos, wco))
+            else:
+                wpos = mpos
 
         return {'raw': line, 'state': state, 'wpos': wpos}
 
     def is_idle(self) -> bool:
         try:
             s = self.status().get('state', None)
-            return (s or '').upper() == 'IDLE'
+            # unacked streamed lines are still waiting in GRBL's RX buffer
+            return (s or '').upper() == 'IDLE' and not self._stream
         except Exception:
             return False
 
+    def poll_idle(self, wait: float = 0.05) -> Optional[bool]:
+        """Wait up to ``wait`` s for a status report without blocking on readline.
+
+        Returns True/False once a report arrives (idle means IDLE with no
+        streamed lines unacked), or None if none did. Sends '?' when none is
+        outstanding or the last one went ``wait`` s unanswered.
+        """
+        now = time.time()
+        if not self._status_pending or now - self._status_sent >= wait:
+            self.status_request()
+        deadline = now + wait
+        while self._wait_readable(deadline - time.time()):
+            r = self.status_poll()
+            if r is not None:
+                # unacked streamed lines are still waiting in GRBL's RX buffer
+                return (r['state'] or '').upper() == 'IDLE' and not self._stream
+        return None
+
     def wait_idle(self, timeout: float = 30.0, poll: float = 0.05):
+        # At most one '?' per poll period, but return as soon as an IDLE report
+        # arrives instead of sleeping out the rest of the period.
         t0 = time.time()
         while time.time() - t0 < timeout:
-            if self.is_idle():
+            t_next = time.time() + poll
+            idle = self.poll_idle(poll)
+            if idle:
                 return
-            time.sleep(poll)
+            if idle is not None:
+                rest = t_next - time.time()
+                if rest > 0:
+                    time.sleep(rest)
         raise TimeoutError("GRBL did not become IDLE in time.")
 
     # -------- Movement / coordinates --------
@@ -237,19 +483,33 @@ class GRBL:
     def jog(self, dx: float = 0.0, dy: float = 0.0, feed: Optional[int] = None, wait: bool = True):
         if feed is None:
             feed = self.cfg.feed_travel
-        self.cmd('G91')
-        self.cmd(f'G0 X{dx:.3f} Y{dy:.3f} F{feed}')
-        out = self.cmd('G90')
+        # three lines well inside GRBL's RX buffer: send together, then collect each reply
+        self._drain_stream()
+        self._write_many(b'G91', f'G0 X{dx:.3f} Y{dy:.3f} F{feed}'.encode(), b'G90')
+        self._readlines_until_timeout()
+        self._readlines_until_timeout()
+        out = self._readlines_until_timeout()
         if wait:
             self.wait_idle()
         return out
 
     # -------- Compensation --------
-    def set_compensation(self, comp: Compensation):
+    def set_compensation(self, comp: Optional[Union[Compensation, GridCompensation]]):
         self._comp = comp
+        self._comp_k = None
+        if not isinstance(comp, Compensation):
+            return  # None, or a GridCompensation evaluated through its own height_at
+        a = comp.area
+        dx = a.x1 - a.x0
+        dy = a.y1 - a.y0
+        if comp.hBL == comp.hBR == comp.hTL == comp.hTR or dx <= 0 or dy <= 0:
+            self._comp_k = (comp.hBL,)  # constant height, same as height_at
+        else:
+            self._comp_k = (float(a.x0), float(a.x1), float(a.y0), float(a.y1), dx, dy,
+                            comp.hBL, comp.hBR, comp.hTL, comp.hTR)
 
     def set_compensation_from_widget(self, widget_state: Dict):
-        self._comp = Compensation.from_widget_state(widget_state)
+        self.set_compensation(Compensation.from_widget_state(widget_state))
 
     @staticmethod
     def _apply_pos_offset(base: float, pos_offset: float) -> float:
@@ -260,12 +520,25 @@ class GRBL:
         return min(1.0, v)
 
     def compensated_pos(self, x: float, y: float, pos_offset: float = 0.0) -> float:
-        base = self._comp.height_at(x, y) if self._comp is not None else 1.0
+        # Inlined Compensation.height_at over the terms cached by set_compensation;
+        # called once per vertex while drawing.
+        k = self._comp_k
+        if k is None:
+            base = self._comp.height_at(x, y) if self._comp is not None else 1.0
+        elif len(k) == 1:
+            base = k[0]
+        else:
+            x0, x1, y0, y1, dx, dy, hBL, hBR, hTL, hTR = k
+            u = ((x0 if x < x0 else x1 if x > x1 else x) - x0) / dx
+            v = ((y0 if y < y0 else y1 if y > y1 else y) - y0) / dy
+            base = (1-u)*(1-v)*hBL + u*(1-v)*hBR + (1-u)*v*hTL + u*v*hTR
+        if pos_offset == 0.0 and 0.0 <= base <= 1.0:
+            return base
         return self._apply_pos_offset(base, pos_offset)
 
     # -------- Pen control with smooth stepping --------
     def _servo_map(self, pos: float) -> int:
-        pos = float(max(0.0, min(1.0, pos)))
+        pos = float(_clamp(pos, 0.0, 1.0))
         theta_max = math.radians(getattr(self.cfg, "servo_travel_deg", 80.0))
         g = math.asin(pos * math.sin(theta_max)) / theta_max  # 0..1
         s0, s1 = self.cfg.s_down, self.cfg.s_up
@@ -281,13 +554,16 @@ class GRBL:
         self.cmd(f"M3 S{s}", wait_ok=True)
         self._last_servo = s
 
-    def pen_set(self, pos: float, *, step: Optional[float] = None, step_delay_s: float = 0.03, wait: bool = False):
+    def pen_set(self, pos: float, *, step: Optional[float] = None, step_delay_s: float = 0.03, wait: bool = False,
+                smooth: str = "grbl"):
         """
         Set servo to absolute pos in [0..1].
         If step is provided (e.g. 0.1), ramp in increments for smoother motion.
+        smooth: "grbl" streams the ramp as M3/G4 dwell pairs so GRBL times the
+        steps; "host" sends each step and sleeps in Python (legacy, for debugging).
         """
-        target = float(max(0.0, min(1.0, pos)))
-        current = float(max(0.0, min(1.0, self._pen_pos)))
+        target = float(_clamp(pos, 0.0, 1.0))
+        current = float(_clamp(self._pen_pos, 0.0, 1.0))
 
         if step is None or step <= 0.0 or abs(target - current) <= step:
             self._issue_servo(target)
@@ -295,18 +571,38 @@ class GRBL:
         else:
             # Determine direction and sweep in uniform steps
             direction = 1.0 if target > current else -1.0
+            steps: List[float] = []
             p = current
             while True:
                 p_next = p + direction * step
                 if (direction > 0 and p_next >= target) or (direction < 0 and p_next <= target):
                     break
-                self._issue_servo(p_next)
-                self._pen_pos = p_next
-                time.sleep(step_delay_s)
+                steps.append(p_next)
                 p = p_next
-            # Final target
-            if self._pen_pos != target:
-                self._issue_servo(target)
+            if smooth == "host":
+                for p in steps:
+                    self._issue_servo(p)
+                    self._pen_pos = p
+                    time.sleep(step_delay_s)
+                # Final target
+                if self._pen_pos != target:
+                    self._issue_servo(target)
+                    self._pen_pos = target
+            else:
+                self._drain_stream()
+                lines: List[str] = []
+                for p in steps + [target]:
+                    s = self._servo_map(p)
+                    if s != self._last_servo:  # same skip as _issue_servo
+                        lines.append(f"M3 S{s}")
+                        self._last_servo = s
+                    if p != target and step_delay_s > 0:
+                        lines.append(f"G4 P{step_delay_s:.3f}")
+                self.stream(lines)
+                # M3/G4 acks only come once the planner has emptied and each dwell
+                # has run, so allow the dwell time plus stream()'s 30 s for motion
+                dwell_s = step_delay_s * len(steps) if step_delay_s > 0 else 0.0
+                self._drain_stream(timeout=dwell_s + 30.0)
                 self._pen_pos = target
 
         if wait:
@@ -323,7 +619,7 @@ class GRBL:
         Incrementally lift or lower relative to the last commanded position.
         Positive delta lifts toward 1.0, negative pushes toward 0.0.
         """
-        target = max(0.0, min(1.0, self._pen_pos + float(delta)))
+        target = _clamp(self._pen_pos + float(delta), 0.0, 1.0)
         self.pen_set(target, step=step, step_delay_s=step_delay_s, wait=wait)
 
     # -------- Simple motion helpers --------
@@ -334,12 +630,11 @@ class GRBL:
         Starts at (x0, y0). If close is True, returns to the start.
         """
         self.pen_up(wait=False)
-        self.move_xy(x0, y0, wait=False)
-        self.move_xy(x0 + w, y0, wait=False)
-        self.move_xy(x0 + w, y0 + h, wait=False)
-        self.move_xy(x0, y0 + h, wait=False)
+        corners = [(x0, y0), (x0 + w, y0), (x0 + w, y0 + h), (x0, y0 + h)]
         if close:
-            self.move_xy(x0, y0, wait=False)
+            corners.append((x0, y0))
+        feed = self.cfg.feed_travel
+        self.stream(f'G0 X{self._clip_x(x):.3f} Y{self._clip_y(y):.3f} F{feed}' for x, y in corners)
         if wait:
             self.wait_idle()
 
@@ -370,7 +665,7 @@ class GRBL:
 
     # -------- Clipping --------
     def _clip_x(self, x: float) -> float:
-        return max(0.0, min(self.cfg.x_max, x)) if self.cfg.clip_to_bed else x
+        return _clamp(x, 0.0, self.cfg.x_max) if self.cfg.clip_to_bed else x
 
     def _clip_y(self, y: float) -> float:
-        return max(0.0, min(self.cfg.y_max, y)) if self.cfg.clip_to_bed else y
+        return _clamp(y, 0.0, self.cfg.y_max) if self.cfg.clip_to_bed else y